@@ -29,6 +29,8 @@ WINDOWED_WIDTH, WINDOWED_HEIGHT, DESKTOP_WIDTH, DESKTOP_HEIGHT = get_optimal_dim
 # Screen dimensions (valores padrão para janela)
 WIDTH, HEIGHT = WINDOWED_WIDTH, WINDOWED_HEIGHT
 FPS = 60
+IDLE_FPS = 10  # Frame cap while hidden and nothing changed recently
+IDLE_AFTER_SECONDS = 0.5
 
 # Configurações de fullscreen
 FULLSCREEN_CONFIG = {
@@ -6,8 +6,35 @@ import random
 import time
 import datetime
 import math
+import numpy as np
 from threading import Lock
 
+class ChartSeries:
+    """Price history stored as parallel arrays
+    
+    Indexing and iteration still yield {'timestamp', 'price', 'volume'} dicts
+    so list-of-dict consumers keep working.
+    """
+    
+    def __init__(self, timestamps, prices, volumes):
+        self.timestamps = timestamps
+        self.prices = prices
+        self.volumes = volumes
+    
+    def __len__(self):
+        return len(self.prices)
+    
+    def __getitem__(self, index):
+        return {
+            'timestamp': self.timestamps[index],
+            'price': float(self.prices[index]),
+            'volume': float(self.volumes[index])
+        }
+    
+    def __iter__(self):
+        for index in range(len(self.prices)):
+            yield self[index]
+
 class HistoricalDataGenerator:
     """Generate realistic historical price data"""
     
@@ -30,7 +57,9 @@ class HistoricalDataGenerator:
             points = min(timeframe_days, 365)
             interval_seconds = 86400  # 1 day
         
-        data_points = []
+        prices = np.empty(points, dtype=np.float64)
+        volumes = np.empty(points, dtype=np.float64)
+        timestamps = []
         current_time = time.time()
         
         # Start with a price that makes sense relative to current price
@@ -47,7 +76,7 @@ class HistoricalDataGenerator:
         price = base_price
         for i in range(points):
             timestamp_seconds = current_time - ((points - i) * interval_seconds)
-            timestamp = datetime.datetime.fromtimestamp(timestamp_seconds)
+            timestamps.append(datetime.datetime.fromtimestamp(timestamp_seconds))
             
             # Add some trend (slight upward bias)
             trend = 0.0001 * (i / points)
@@ -60,16 +89,13 @@ class HistoricalDataGenerator:
             price = max(price, current_price * 0.1)  # Don't go below 10% of current
             price = min(price, current_price * 5.0)   # Don't go above 500% of current
             
-            data_points.append({
-                'timestamp': timestamp,
-                'price': price,
-                'volume': random.uniform(1000000, 10000000)  # Random volume
-            })
+            prices[i] = price
+            volumes[i] = random.uniform(1000000, 10000000)  # Random volume
         
         # Ensure the last price is close to current price
-        data_points[-1]['price'] = current_price * random.uniform(0.98, 1.02)
+        prices[-1] = current_price * random.uniform(0.98, 1.02)
         
-        return data_points
+        return ChartSeries(timestamps, prices, volumes)
 
 class ChartRenderer:
     """Render price charts using pygame"""
@@ -0,0 +1,24 @@
+"""
+Chart geometry math, JIT-compiled when numba is available
+"""
+import numpy as np
+from utils.jit import njit
+
+@njit(cache=True)
+def compute_chart_points(prices, left, bottom, width, height):
+    """Map a price series onto integer screen points inside a chart rect
+    
+    Returns (points, min_price, max_price) where points is an (N, 2) int32 array.
+    """
+    n = prices.shape[0]
+    min_p = prices.min()
+    max_p = prices.max()
+    price_range = max_p - min_p if max_p != min_p else max_p * 0.1
+    
+    x_step = width / (n - 1)
+    y_scale = height / price_range
+    out = np.empty((n, 2), np.int32)
+    for i in range(n):
+        out[i, 0] = int(left + i * x_step)
+        out[i, 1] = int(bottom - (prices[i] - min_p) * y_scale)
+    return out, min_p, max_p
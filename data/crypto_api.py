@@ -8,6 +8,7 @@ import time
 import datetime
 import json
 import os
+import numpy as np
 from threading import Lock
 from time import sleep
 
@@ -36,6 +37,21 @@ fear_greed_data = {
     'data_age': 0
 }
 
+# Bumped whenever the matching global above changes, so the UI can skip
+# redrawing panels whose data is unchanged. Call under the matching lock.
+data_versions = {'crypto': 0, 'news': 0, 'fear_greed': 0}
+
+def mark_data_updated(kind):
+    """Record that the 'crypto', 'news' or 'fear_greed' data changed"""
+    data_versions[kind] += 1
+
+def get_data_version(kind):
+    """Get the change counter for 'crypto', 'news' or 'fear_greed' data"""
+    return data_versions[kind]
+
+# Column-wise copy of crypto_data, rebuilt lazily when its version changes
+crypto_soa = None
+
 class SmartCacheManager:
     """Intelligent caching system that reduces API dependency"""
     
@@ -401,6 +417,7 @@ def update_crypto_data():
     if cached_data:
         with data_lock:
             crypto_data = cached_data
+            mark_data_updated('crypto')
         print(f"🔄 Loaded {len(cached_data)} coins from cache")
         
         if not loading_state['crypto_data']:
@@ -421,6 +438,7 @@ def update_crypto_data():
                 if new_data:
                     with data_lock:
                         crypto_data = new_data
+                        mark_data_updated('crypto')
                     
                     # Update daily rank tracking
                     from utils.rank_tracker import update_daily_rank_tracking
@@ -462,6 +480,7 @@ def update_news_data():
     if cached_news:
         with news_lock:
             news_list = cached_news
+            mark_data_updated('news')
         print(f"🔄 Loaded {len(cached_news)} news articles from cache")
         
         if not loading_state['news_data']:
@@ -476,6 +495,7 @@ def update_news_data():
                 if new_news:
                     with news_lock:
                         news_list = new_news
+                        mark_data_updated('news')
                     
                     if not loading_state['news_data']:
                         update_loading_state('news_data', True)
@@ -505,6 +525,7 @@ def update_fear_greed():
                 'trend_7d': cached_fg.get('trend_7d', 0),
                 'trend_30d': cached_fg.get('trend_30d', 0),
             })
+            mark_data_updated('fear_greed')
         print("🔄 Loaded Fear & Greed historical data from cache")
         
         if not loading_state['fear_greed_data']:
@@ -523,6 +544,7 @@ def update_fear_greed():
                     fear_greed_data['is_realtime'] = True
                     fear_greed_data['data_age'] = time.time() - local_fg_calculator.last_calculation
                     fear_greed_data['last_updated'] = time.time()
+                    mark_data_updated('fear_greed')
             
             # Only fetch API data for historical comparison (much less frequently)
             force_daily = cache_manager.should_refresh_daily()
@@ -539,6 +561,7 @@ def update_fear_greed():
                             'trend_7d': api_data['trend_7d'],
                             'trend_30d': api_data['trend_30d'],
                         })
+                        mark_data_updated('fear_greed')
                     
                     if force_daily:
                         print("✅ Daily F&G historical data refresh completed")
@@ -558,6 +581,40 @@ def get_crypto_data():
     with data_lock:
         return crypto_data.copy()
 
+def get_crypto_data_with_version():
+    """Get a copy of the crypto data and the version it matches, read together"""
+    with data_lock:
+        return crypto_data.copy(), data_versions['crypto']
+
+def get_crypto_count():
+    """Get the number of loaded cryptocurrencies without copying the list"""
+    with data_lock:
+        return len(crypto_data)
+
+def build_crypto_soa(data, version=None):
+    """Build a structure-of-arrays view of a list of coin dicts
+    
+    Missing or None numbers become 0, which the formatters show as N/A.
+    """
+    return {
+        'version': version,
+        'symbol': [coin['symbol'].upper() for coin in data],
+        'price': np.asarray([coin.get('current_price') or 0 for coin in data], dtype=np.float64),
+        'market_cap': np.asarray([coin.get('market_cap') or 0 for coin in data], dtype=np.float64),
+        'volume': np.asarray([coin.get('total_volume') or 0 for coin in data], dtype=np.float64),
+        'change_24h': np.asarray([coin.get('price_change_percentage_24h') or 0 for coin in data],
+                                 dtype=np.float64)
+    }
+
+def get_crypto_soa():
+    """Get crypto data as column arrays, tagged with the data version they match"""
+    global crypto_soa
+    with data_lock:
+        version = data_versions['crypto']
+        if crypto_soa is None or crypto_soa['version'] != version:
+            crypto_soa = build_crypto_soa(crypto_data, version)
+        return crypto_soa
+
 def get_news_data():
     """Get current news data thread-safely"""
     with news_lock:
@@ -171,9 +171,9 @@ class ProfessionalDebugRenderer:
             print(f"📍 Debug position: {self.positions[self.position]}")
     
     def render(self, screen, layout_areas, fullscreen_manager, clock, bubble_manager, quality_mode=True):
-        """Render professional debug overlay"""
+        """Render professional debug overlay, returning the rect it covers"""
         if not self.enabled:
-            return
+            return None
         
         # Professional fonts
         try:
@@ -215,6 +215,7 @@ class ProfessionalDebugRenderer:
             
             screen.blit(bg_surface, (x - 8, y - 4))
             screen.blit(text_surface, (x, y))
+            return pygame.Rect(x - 8, y - 4, bg_width, bg_height)
             
         else:
             # Detailed mode
@@ -248,6 +249,7 @@ class ProfessionalDebugRenderer:
             text3 = pygame.font.SysFont("Segoe UI", 10)
             text3_surface = text3.render(line3, True, (140, 160, 190))
             screen.blit(text3_surface, (debug_x, debug_y + 36))
+            return pygame.Rect(debug_x - 8, debug_y - 8, bg_width, bg_height)
 
 def main():
     """Enhanced main application with synchronized auto-redistribution"""
@@ -295,14 +297,22 @@ def main():
         running = True
         last_screen_size = screen.get_size()
         
+        # Dirty-rect presentation state: what the previous frame covered
+        last_debug_rect = None
+        modal_was_active = False
+        
         # Enhanced physics update function
         def update_enhanced_physics():
             """Update physics with enhanced quality settings"""
+            target_fps = 90 if quality_mode else 60
+            if not pygame.display.get_active():
+                # Minimized: nobody sees the bubbles, so drop to the idle
+                # rate unless data or input changed recently
+                target_fps = min(target_fps, dashboard.desired_fps)
+            
             if quality_mode:
-                target_fps = 90
                 dt = min(clock.tick(target_fps) / 1000.0, 1.0/45.0)
             else:
-                target_fps = 60
                 dt = min(clock.tick(target_fps) / 1000.0, 1.0/30.0)
             
             sub_steps = 2 if quality_mode else 1
@@ -323,6 +333,7 @@ def main():
         while running:
             # Enhanced event handling with synchronized auto-redistribution
             for event in pygame.event.get():
+                dashboard.mark_dirty()
                 if event.type == pygame.QUIT:
                     print("🔄 Shutting down...")
                     save_daily_ranks()
@@ -449,20 +460,33 @@ def main():
             # Clear with professional background
             screen.fill(COLORS['background'])
             
-            # Render dashboard
-            dashboard.render(screen)
+            # Render dashboard (returns the panel rects that changed)
+            dirty_rects = dashboard.render(screen)
             
             # Render enhanced bubbles
             bubble_manager.render(screen, layout_areas)
+            dirty_rects.append(layout_areas['bubble_area'])
             
             # Render enhanced modal
             modal_manager.render(screen)
+            modal_active = modal_manager.has_active_modal()
             
             # Professional debug overlay
-            debug_renderer.render(screen, layout_areas, fullscreen_manager, clock, bubble_manager, quality_mode)
+            debug_rect = debug_renderer.render(screen, layout_areas, fullscreen_manager, clock, bubble_manager, quality_mode)
+            for rect in (debug_rect, last_debug_rect):
+                if rect:
+                    dirty_rects.append(rect)
+            last_debug_rect = debug_rect
             
-            # Update display
-            pygame.display.flip()
+            # Update display: only the changed rects, unless a modal covers
+            # (or just uncovered) the screen or the rects add up to all of it
+            screen_area = current_screen_size[0] * current_screen_size[1]
+            if (modal_active or modal_was_active or
+                    sum(rect.width * rect.height for rect in dirty_rects) >= screen_area):
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+            modal_was_active = modal_active
     
     except KeyboardInterrupt:
         print("\n🔄 Graceful shutdown...")
@@ -4,17 +4,51 @@ Fixes pinned point bug and adds axis value tracking
 """
 
 import pygame
-import math
 import time
 import random
-import os
+import numpy as np
 from typing import List, Tuple, Dict, Optional
 from datetime import datetime, timedelta
+from functools import cached_property
 
 from config.settings import COLORS
 from utils.formatters import format_large_number, format_supply, format_price
+from utils.render_cache import render_text, fblits
+from utils.logo_loader import get_logo_surface
+from utils.jit import njit
 from data.chart_data import HistoricalDataGenerator
 
+# Per-timeframe generation parameters:
+# (points, volatility, seconds per point, trend freq, trend amp, wave freq, wave amp)
+SERIES_PARAMS = {
+    '1D': (24, 0.01, 3600, 6, 0.03, 0, 0.0),
+    '7D': (168, 0.02, 3600, 6, 0.03, 0, 0.0),
+    '30D': (30, 0.03, 86400, 3, 0.08, 0, 0.0),
+    '90D': (90, 0.05, 86400, 3, 0.08, 0, 0.0),
+    '1Y': (365, 0.1, 86400, 2, 0.15, 4, 0.05),
+}
+
+@njit(cache=True)
+def _gen_series(noise_samples, volume_variation, base_price, volatility, seconds_per_point,
+                trend_freq, trend_amp, wave_freq, wave_amp):
+    """Generate prices, volumes and age-in-seconds arrays for a synthetic series
+    
+    noise_samples are uniform [0, 1) draws and volume_variation the per-point
+    volume multipliers, both supplied by the caller's random generator.
+    """
+    n = noise_samples.shape[0]
+    phase = np.arange(n) / n * np.pi
+    trend = np.sin(phase * trend_freq) * trend_amp + np.cos(phase * wave_freq) * wave_amp
+    noise = (noise_samples - 0.5) * volatility
+    momentum = np.sin(phase * 8) * 0.02
+    
+    prices = base_price * (1 + trend + noise + momentum)
+    prices = np.minimum(np.maximum(prices, base_price * 0.5), base_price * 5.0)
+    
+    volumes = 1500000000 * volume_variation
+    ages = (n - np.arange(n)) * seconds_per_point
+    return prices, volumes, ages
+
 class OptimizedCryptoChart:
     """Optimized crypto chart with fixed interactions and axis tracking
     
@@ -41,16 +75,35 @@ class OptimizedCryptoChart:
         self.sidebar_x = self.chart_x + self.chart_width + 30
         self.sidebar_width = 200  # Reduced from 240
         
+        # Static grid geometry: (start, end) of each line
+        self._chart_bottom = self.chart_y + self.chart_height
+        chart_right = self.chart_x + self.chart_width
+        self._hlines = [((self.chart_x, y), (chart_right, y))
+                        for y in (self.chart_y + (i / 5) * self.chart_height for i in range(6))]
+        self._vlines = [((x, self.chart_y), (x, self._chart_bottom))
+                        for x in (self.chart_x + (i / 6) * self.chart_width for i in range(7))]
+        self._y_labels = []  # (surface, position), rebuilt per data set
+        self._x_axis_labels = []
+        
         # State
         self.time_range = "7D"
-        self.hovered_point = None
-        self.pinned_point = None
-        self.pinned_point_data = None  # Store actual data, not just index
+        self.hovered_index = None
+        self.pinned_index = None
         
         # Data
         self.data_points = []
-        self.min_point = None
-        self.max_point = None
+        self._xs = []  # Screen coordinates of each data point
+        self._ys = []
+        self._line_points = []
+        self._fill_points = []
+        self.prices = np.empty(0)
+        self._rng = np.random.default_rng()
+        self.min_idx = None
+        self.max_idx = None
+        self.min_price = 0.0
+        self.max_price = 0.0
+        self._x_scale = 0.0
+        self._y_scale = 0.0
         
         # Crosshair position
         self.crosshair_x = None
@@ -79,6 +132,18 @@ class OptimizedCryptoChart:
         self.font_small = pygame.font.SysFont("Segoe UI", 12)
         self.font_tiny = pygame.font.SysFont("Segoe UI", 10)
         
+        # Reusable translucent layer for the area fill under the line
+        self._fill_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # Persistent tooltip sprite, redrawn only when the shown point changes
+        self._tooltip_surf = pygame.Surface((160, 100), pygame.SRCALPHA)
+        self._tooltip_bundle = None
+        self._tooltip_pinned = False
+        
+        # Pre-rendered button and sidebar chrome
+        self._button_sprites = self._create_button_sprites()
+        self._sidebar_bg = self._create_sidebar_background()
+        
         # Generate initial data
         self.generate_data()
         
@@ -100,74 +165,87 @@ class OptimizedCryptoChart:
             })
         return buttons
     
+    def _create_button_sprites(self):
+        """Pre-render every timeframe button in its active and inactive state"""
+        sprites = {}
+        for button in self.range_buttons:
+            for active in (True, False):
+                if active:
+                    bg_color = (55, 65, 81)
+                    text_color = (255, 255, 255)
+                    border_color = (75, 85, 99)
+                else:
+                    bg_color = (31, 41, 55)
+                    text_color = self.text_color
+                    border_color = (55, 65, 81)
+                
+                sprite = pygame.Surface(button['rect'].size, pygame.SRCALPHA)
+                sprite_rect = sprite.get_rect()
+                pygame.draw.rect(sprite, bg_color, sprite_rect, border_radius=4)
+                pygame.draw.rect(sprite, border_color, sprite_rect, 1, border_radius=4)
+                
+                text_surface = render_text(self.font_small, button['range'], text_color)
+                sprite.blit(text_surface, text_surface.get_rect(center=sprite_rect.center))
+                sprites[(button['range'], active)] = sprite
+        return sprites
+    
+    def _create_sidebar_background(self):
+        """Pre-render the rounded sidebar panel with its title"""
+        sprite = pygame.Surface((self.sidebar_width, self.chart_height), pygame.SRCALPHA)
+        sprite_rect = sprite.get_rect()
+        pygame.draw.rect(sprite, (31, 41, 55), sprite_rect, border_radius=6)
+        pygame.draw.rect(sprite, (55, 65, 81), sprite_rect, 1, border_radius=6)
+        sprite.blit(render_text(self.font_medium, "MARKET DATA", (255, 255, 255)), (15, 15))
+        return sprite
+    
     def generate_data(self):
         """Generate data and clear pinned point"""
         # Clear pinned point when changing timeframe
-        self.pinned_point = None
-        self.pinned_point_data = None
+        self.hovered_index = None
+        self.pinned_index = None
         
-        points_count = {
-            '1D': 24, '7D': 168, '30D': 30, '90D': 90, '1Y': 365
-        }[self.time_range]
-        
-        data = []
         base_price = 655.95
-        
-        for i in range(points_count):
-            volatility = {'1D': 0.01, '7D': 0.02, '30D': 0.03, '90D': 0.05, '1Y': 0.1}[self.time_range]
-            
-            if self.time_range == '1Y':
-                trend = math.sin(i / points_count * math.pi * 2) * 0.15 + math.cos(i / points_count * math.pi * 4) * 0.05
-            elif self.time_range in ['30D', '90D']:
-                trend = math.sin(i / points_count * math.pi * 3) * 0.08
-            else:
-                trend = math.sin(i / points_count * math.pi * 6) * 0.03
-            
-            noise = (random.random() - 0.5) * volatility
-            momentum = math.sin(i / points_count * math.pi * 8) * 0.02
-            
-            price = base_price * (1 + trend + noise + momentum)
-            price = max(price, base_price * 0.5)
-            price = min(price, base_price * 5.0)
-            
-            now = datetime.now()
-            if self.time_range == '1D':
-                date = now - timedelta(hours=points_count - i)
-            elif self.time_range == '7D':
-                date = now - timedelta(hours=points_count - i)
-            elif self.time_range == '30D':
-                date = now - timedelta(days=points_count - i)
-            elif self.time_range == '90D':
-                date = now - timedelta(days=points_count - i)
-            else:  # 1Y
-                date = now - timedelta(days=points_count - i)
-            
-            base_volume = 1500000000
-            volume_variation = random.uniform(0.7, 1.3)
-            volume = base_volume * volume_variation
-            
-            data.append({
-                'date': date,
+        points_count, *params = SERIES_PARAMS[self.time_range]
+        prices, volumes, ages = _gen_series(self._rng.random(points_count),
+                                            self._rng.uniform(0.7, 1.3, points_count),
+                                            base_price, *params)
+        
+        self.prices = prices
+        
+        # Date arithmetic stays in Python
+        now = datetime.now()
+        self.data_points = [
+            {
+                'date': now - timedelta(seconds=age),
                 'price': price,
                 'volume': volume,
                 'index': i
-            })
-        
-        self.data_points = data
+            }
+            for i, (price, volume, age) in enumerate(zip(prices.tolist(), volumes.tolist(), ages.tolist()))
+        ]
         self._calculate_min_max()
-        self._calculate_performance_stats()
+        self._calculate_screen_points()
+        self._calculate_y_labels()
+        self._calculate_x_labels()
+        
+        self._hover_bundle_index = None
+        self._hover_bundle = None
+        
+        # Performance stats are computed lazily for the new data
+        self.__dict__.pop('performance_stats', None)
     
-    def _calculate_performance_stats(self):
-        """Calculate performance statistics"""
+    @cached_property
+    def performance_stats(self) -> Dict[str, float]:
+        """Performance statistics, calculated on first access"""
         if len(self.data_points) < 2:
-            return
+            return {}
             
         current = self.data_points[-1]['price']
         first = self.data_points[0]['price']
         
         current_change = ((current - first) / first) * 100
         
-        self.performance_stats = {
+        stats = {
             '1D': current_change + random.uniform(-0.5, 0.5),
             '7D': current_change + random.uniform(-2, 2), 
             '30D': current_change + random.uniform(-5, 5),
@@ -175,36 +253,110 @@ class OptimizedCryptoChart:
             '1Y': current_change + random.uniform(-20, 20)
         }
         
-        self.performance_stats[self.time_range] = current_change
+        stats[self.time_range] = current_change
+        return stats
     
     def _calculate_min_max(self):
         """Calculate min and max points"""
         if not self.data_points:
             return
-        self.min_point = min(self.data_points, key=lambda p: p['price'])
-        self.max_point = max(self.data_points, key=lambda p: p['price'])
+        self.min_idx = int(self.prices.argmin())
+        self.max_idx = int(self.prices.argmax())
+        self.min_price = float(self.prices[self.min_idx])
+        self.max_price = float(self.prices[self.max_idx])
+        
+        # Data -> screen scale factors
+        self._x_scale = self.chart_width / max(1, len(self.data_points) - 1)
+        self._y_scale = self.chart_height / (self.max_price - self.min_price or 1)
+    
+    def _calculate_y_labels(self):
+        """Render the Y-axis price labels for the current min/max"""
+        self._y_labels = []
+        if not self.data_points:
+            return
+        
+        min_price = self.min_price
+        max_price = self.max_price
+        price_range = max_price - min_price or 1
+        
+        for i in range(6):
+            price = min_price + (i / 5) * price_range
+            y = self.chart_y + self.chart_height - (i / 5) * self.chart_height
+            
+            if price >= 1000:
+                price_text = f"${price:.0f}"
+            elif price >= 100:
+                price_text = f"${price:.1f}"
+            else:
+                price_text = f"${price:.2f}"
+            
+            text_surface = render_text(self.font_tiny, price_text, self.text_color)
+            self._y_labels.append((text_surface, (self.chart_x - 48, y - 8)))
+    
+    def _calculate_x_labels(self):
+        """Format and render the X-axis date labels for the current timeframe"""
+        self._x_axis_labels = []
+        if len(self.data_points) < 2:
+            return
+        
+        for i in range(7):
+            data_index = int((i / 6) * (len(self.data_points) - 1))
+            point = self.data_points[data_index]
+            x = self.chart_x + (i / 6) * self.chart_width
+            
+            if self.time_range == '1D':
+                if i % 2 == 0:
+                    time_text = point['date'].strftime("%H:%M")
+                else:
+                    continue
+            elif self.time_range == '7D':
+                time_text = point['date'].strftime("%d/%m")
+            elif self.time_range == '30D':
+                time_text = point['date'].strftime("%d/%m")
+            elif self.time_range == '90D':
+                if point['date'].day in [1, 15]:
+                    time_text = point['date'].strftime("%d/%m")
+                else:
+                    continue
+            else:  # 1Y
+                if point['date'].day == 1:
+                    time_text = point['date'].strftime("%b")
+                else:
+                    continue
+            
+            text_surface = render_text(self.font_tiny, time_text, self.text_color)
+            text_rect = text_surface.get_rect(center=(x, self.chart_y + self.chart_height + 12))
+            self._x_axis_labels.append((text_surface, text_rect))
+    
+    def _calculate_screen_points(self):
+        """Cache the screen coordinates of every data point and the line/fill polygons"""
+        xs = self.chart_x + (np.arange(len(self.prices)) * self._x_scale).astype(np.int32)
+        ys = self._chart_bottom - (self.prices - self.min_price) * self._y_scale
+        points_array = np.column_stack([xs, ys.astype(np.int32)])
+        
+        self._xs = points_array[:, 0].tolist()
+        self._ys = points_array[:, 1].tolist()
+        self._line_points = points_array.tolist()
+        self._fill_points = self._line_points + [
+            [self.chart_x + self.chart_width, self.chart_y + self.chart_height],
+            [self.chart_x, self.chart_y + self.chart_height],
+        ]
     
     def get_chart_position(self, point_index: int, price: float) -> Tuple[int, int]:
         """Convert data point to screen coordinates"""
         if not self.data_points:
             return (0, 0)
-            
-        min_price = self.min_point['price']
-        max_price = self.max_point['price']
-        price_range = max_price - min_price or 1
         
-        x = self.chart_x + (point_index / max(1, len(self.data_points) - 1)) * self.chart_width
-        y = self.chart_y + self.chart_height - ((price - min_price) / price_range) * self.chart_height
-        
-        return (int(x), int(y))
+        return (self.chart_x + int(point_index * self._x_scale),
+                int(self._chart_bottom - (price - self.min_price) * self._y_scale))
     
     def get_price_from_y(self, y: int) -> float:
         """Get price value from Y coordinate"""
         if not self.data_points:
             return 0
             
-        min_price = self.min_point['price']
-        max_price = self.max_point['price']
+        min_price = self.min_price
+        max_price = self.max_price
         price_range = max_price - min_price or 1
         
         # Invert Y calculation
@@ -224,40 +376,39 @@ class OptimizedCryptoChart:
         
         return self.data_points[index]['date']
     
-    def find_nearest_point(self, mouse_pos: Tuple[int, int]) -> Optional[Dict]:
-        """Find nearest data point with crosshair update"""
+    def find_nearest_point(self, mouse_pos: Tuple[int, int]) -> Optional[int]:
+        """Find index of the nearest data point with crosshair update"""
         if not self.data_points:
             return None
             
         mouse_x, mouse_y = mouse_pos
+        rel_x = mouse_x - self.chart_x
+        rel_y = mouse_y - self.chart_y
         
         # Update crosshair position
-        if (self.chart_x <= mouse_x <= self.chart_x + self.chart_width and
-            self.chart_y <= mouse_y <= self.chart_y + self.chart_height):
-            self.crosshair_x = mouse_x
-            self.crosshair_y = mouse_y
-        else:
+        if (rel_x < 0) | (rel_x > self.chart_width) | (rel_y < 0) | (rel_y > self.chart_height):
             self.crosshair_x = None
             self.crosshair_y = None
             return None
+        self.crosshair_x = mouse_x
+        self.crosshair_y = mouse_y
         
-        # Find closest X position
-        chart_relative_x = mouse_x - self.chart_x
-        data_index = round((chart_relative_x / self.chart_width) * (len(self.data_points) - 1))
-        data_index = max(0, min(data_index, len(self.data_points) - 1))
-        
-        point = self.data_points[data_index]
-        px, py = self.get_chart_position(point['index'], point['price'])
-        
-        return {
-            **point,
-            'screen_x': px,
-            'screen_y': py
-        }
+        # Closest X position, rounded with integer math (points are evenly spaced)
+        last = len(self.data_points) - 1
+        data_index = (rel_x * last * 2 + self.chart_width) // (2 * self.chart_width)
+        return 0 if data_index < 0 else last if data_index > last else data_index
+    
+    def hovered_point(self) -> Optional[Tuple[int, int, float, datetime]]:
+        """Screen position, price and date of the hovered data point"""
+        idx = self.hovered_index
+        if idx is None:
+            return None
+        point = self.data_points[idx]
+        return (self._xs[idx], self._ys[idx], point['price'], point['date'])
     
     def handle_mouse_move(self, mouse_pos: Tuple[int, int]):
         """Handle mouse movement"""
-        self.hovered_point = self.find_nearest_point(mouse_pos)
+        self.hovered_index = self.find_nearest_point(mouse_pos)
     
     def handle_click(self, mouse_pos: Tuple[int, int]) -> bool:
         """Handle mouse clicks"""
@@ -272,14 +423,12 @@ class OptimizedCryptoChart:
                 return True
         
         # Check chart clicks for pinning
-        if self.hovered_point:
+        if self.hovered_index is not None:
             # Toggle pin on the data point
-            if self.pinned_point_data and self.pinned_point_data['index'] == self.hovered_point['index']:
-                self.pinned_point = None
-                self.pinned_point_data = None
+            if self.pinned_index == self.hovered_index:
+                self.pinned_index = None
             else:
-                self.pinned_point = self.hovered_point
-                self.pinned_point_data = self.hovered_point.copy()
+                self.pinned_index = self.hovered_index
             return True
         
         return False
@@ -290,17 +439,9 @@ class OptimizedCryptoChart:
         logo_size = 40  # Reduced
         logo_x, logo_y = 25, 15
         
-        symbol = coin_data.get('symbol', 'BTC').lower()
-        logo_path = f"assets/logos/{symbol}.png"
-        
-        if os.path.exists(logo_path):
-            try:
-                logo = pygame.image.load(logo_path).convert_alpha()
-                logo = pygame.transform.smoothscale(logo, (logo_size, logo_size))
-                surface.blit(logo, (logo_x, logo_y))
-            except:
-                pygame.draw.circle(surface, self.accent_color, 
-                                 (logo_x + logo_size//2, logo_y + logo_size//2), logo_size//2)
+        logo = get_logo_surface(coin_data.get('symbol', 'BTC'), logo_size)
+        if logo:
+            surface.blit(logo, (logo_x, logo_y))
         else:
             pygame.draw.circle(surface, self.accent_color, 
                              (logo_x + logo_size//2, logo_y + logo_size//2), logo_size//2)
@@ -308,7 +449,7 @@ class OptimizedCryptoChart:
         # Symbol and name
         # Example: BTC (title) / Bitcoin (subtitle), ETH / Ethereum, etc.
         symbol_text = coin_data.get('symbol', 'BTC').upper()
-        symbol_surface = self.font_large.render(symbol_text, True, (255, 255, 255))
+        symbol_surface = render_text(self.font_large, symbol_text, (255, 255, 255))
         surface.blit(symbol_surface, (logo_x + logo_size + 12, logo_y + 2))
         
         # Full name as subtitle (with fallback and length check)
@@ -331,18 +472,18 @@ class OptimizedCryptoChart:
         # Truncate if too long
         if len(full_name) > 25:
             full_name = full_name[:22] + "..."
-        name_surface = self.font_small.render(full_name, True, self.text_color)
+        name_surface = render_text(self.font_small, full_name, self.text_color)
         surface.blit(name_surface, (logo_x + logo_size + 12, logo_y + 26))
         
         # Price and change
         current_price = coin_data.get('current_price', 655.95)
         price_text = f"${current_price:.2f}"
-        price_surface = self.font_large.render(price_text, True, (255, 255, 255))
+        price_surface = render_text(self.font_large, price_text, (255, 255, 255))
         
         change_24h = coin_data.get('price_change_percentage_24h', -0.54) or -0.54
         change_color = (34, 197, 94) if change_24h >= 0 else (239, 68, 68)
         change_text = f"{change_24h:+.2f}%"
-        change_surface = self.font_medium.render(change_text, True, change_color)
+        change_surface = render_text(self.font_medium, change_text, change_color)
         
         price_x = self.width - price_surface.get_width() - 50
         surface.blit(price_surface, (price_x, logo_y))
@@ -370,129 +511,57 @@ class OptimizedCryptoChart:
     
     def draw_timeframe_buttons(self, surface: pygame.Surface):
         """Draw compact timeframe buttons"""
-        for button in self.range_buttons:
-            if button['active']:
-                bg_color = (55, 65, 81)
-                text_color = (255, 255, 255)
-                border_color = (75, 85, 99)
-            else:
-                bg_color = (31, 41, 55)
-                text_color = self.text_color
-                border_color = (55, 65, 81)
-            
-            pygame.draw.rect(surface, bg_color, button['rect'], border_radius=4)
-            pygame.draw.rect(surface, border_color, button['rect'], 1, border_radius=4)
-            
-            text_surface = self.font_small.render(button['range'], True, text_color)
-            text_rect = text_surface.get_rect(center=button['rect'].center)
-            surface.blit(text_surface, text_rect)
+        surface.blits([(self._button_sprites[(button['range'], button['active'])], button['rect'].topleft)
+                       for button in self.range_buttons], doreturn=0)
     
     def draw_grid(self, surface: pygame.Surface):
         """Draw grid with axis labels"""
         # Grid with thinner lines
         grid_color_light = (45, 55, 70)  # Lighter grid color
         
-        # Horizontal lines (thinner)
-        for i in range(6):
-            y = self.chart_y + (i / 5) * self.chart_height
-            pygame.draw.line(surface, grid_color_light, 
-                           (self.chart_x, y), (self.chart_x + self.chart_width, y), 1)
-        
-        # Vertical lines (thinner)
-        for i in range(7):
-            x = self.chart_x + (i / 6) * self.chart_width
-            pygame.draw.line(surface, grid_color_light,
-                           (x, self.chart_y), (x, self.chart_y + self.chart_height), 1)
+        # Horizontal and vertical lines (thinner)
+        for start, end in self._hlines:
+            pygame.draw.line(surface, grid_color_light, start, end, 1)
+        for start, end in self._vlines:
+            pygame.draw.line(surface, grid_color_light, start, end, 1)
         
         # Y-axis labels
         if self.data_points:
-            min_price = self.min_point['price']
-            max_price = self.max_point['price']
-            price_range = max_price - min_price or 1
-            
-            for i in range(6):
-                price = min_price + (i / 5) * price_range
-                y = self.chart_y + self.chart_height - (i / 5) * self.chart_height
-                
-                if price >= 1000:
-                    price_text = f"${price:.0f}"
-                elif price >= 100:
-                    price_text = f"${price:.1f}"
-                else:
-                    price_text = f"${price:.2f}"
-                
-                text_surface = self.font_tiny.render(price_text, True, self.text_color)
-                surface.blit(text_surface, (self.chart_x - 48, y - 8))
+            surface.blits(self._y_labels, doreturn=0)
         
         # X-axis labels
         if self.data_points and len(self.data_points) > 1:
-            for i in range(7):
-                data_index = int((i / 6) * (len(self.data_points) - 1))
-                point = self.data_points[data_index]
-                x = self.chart_x + (i / 6) * self.chart_width
-                
-                if self.time_range == '1D':
-                    if i % 2 == 0:
-                        time_text = point['date'].strftime("%H:%M")
-                    else:
-                        continue
-                elif self.time_range == '7D':
-                    time_text = point['date'].strftime("%d/%m")
-                elif self.time_range == '30D':
-                    time_text = point['date'].strftime("%d/%m")
-                elif self.time_range == '90D':
-                    if point['date'].day in [1, 15]:
-                        time_text = point['date'].strftime("%d/%m")
-                    else:
-                        continue
-                else:  # 1Y
-                    if point['date'].day == 1:
-                        time_text = point['date'].strftime("%b")
-                    else:
-                        continue
-                
-                text_surface = self.font_tiny.render(time_text, True, self.text_color)
-                text_rect = text_surface.get_rect(center=(x, self.chart_y + self.chart_height + 12))
-                surface.blit(text_surface, text_rect)
+            surface.blits(self._x_axis_labels, doreturn=0)
     
     def draw_chart_line(self, surface: pygame.Surface):
         """Draw chart line with fill"""
         if len(self.data_points) < 2:
             return
         
-        points = []
-        for point in self.data_points:
-            x, y = self.get_chart_position(point['index'], point['price'])
-            points.append((x, y))
-        
         # Draw filled area
-        fill_points = points.copy()
-        fill_points.append((self.chart_x + self.chart_width, self.chart_y + self.chart_height))
-        fill_points.append((self.chart_x, self.chart_y + self.chart_height))
-        
-        fill_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        pygame.draw.polygon(fill_surface, (*self.chart_color, 20), fill_points)
-        surface.blit(fill_surface, (0, 0))
+        self._fill_surface.fill((0, 0, 0, 0))
+        pygame.draw.polygon(self._fill_surface, (*self.chart_color, 20), self._fill_points)
+        surface.blit(self._fill_surface, (0, 0))
         
         # Draw main line (thinner)
-        pygame.draw.lines(surface, self.chart_color, False, points, 1)
+        pygame.draw.lines(surface, self.chart_color, False, self._line_points, 1)
         
         # Draw min/max markers
-        if self.min_point and self.max_point:
+        if self.min_idx is not None and self.max_idx is not None:
             # Min marker
-            min_x, min_y = self.get_chart_position(self.min_point['index'], self.min_point['price'])
+            min_x, min_y = self._xs[self.min_idx], self._ys[self.min_idx]
             pygame.draw.circle(surface, (239, 68, 68), (min_x, min_y), 4)
             
-            min_text = f"${self.min_point['price']:.2f}"
-            min_surface = self.font_tiny.render(min_text, True, (239, 68, 68))
+            min_text = f"${self.min_price:.2f}"
+            min_surface = render_text(self.font_tiny, min_text, (239, 68, 68))
             surface.blit(min_surface, (min_x - min_surface.get_width() // 2, min_y + 8))
             
             # Max marker
-            max_x, max_y = self.get_chart_position(self.max_point['index'], self.max_point['price'])
+            max_x, max_y = self._xs[self.max_idx], self._ys[self.max_idx]
             pygame.draw.circle(surface, (34, 197, 94), (max_x, max_y), 4)
             
-            max_text = f"${self.max_point['price']:.2f}"
-            max_surface = self.font_tiny.render(max_text, True, (34, 197, 94))
+            max_text = f"${self.max_price:.2f}"
+            max_surface = render_text(self.font_tiny, max_text, (34, 197, 94))
             surface.blit(max_surface, (max_x - max_surface.get_width() // 2, max_y - 20))
     
     def draw_crosshair_with_values(self, surface: pygame.Surface):
@@ -500,13 +569,11 @@ class OptimizedCryptoChart:
         if self.crosshair_x is None or self.crosshair_y is None:
             return
         
-        # Draw crosshair lines (thinner)
-        pygame.draw.line(surface, self.crosshair_color, 
-                        (self.chart_x, self.crosshair_y), 
-                        (self.chart_x + self.chart_width, self.crosshair_y), 1)
-        pygame.draw.line(surface, self.crosshair_color, 
-                        (self.crosshair_x, self.chart_y), 
-                        (self.crosshair_x, self.chart_y + self.chart_height), 1)
+        # Draw crosshair lines (1px axis-aligned strips are plain fills)
+        surface.fill(self.crosshair_color,
+                     (self.chart_x, self.crosshair_y, self.chart_width + 1, 1))
+        surface.fill(self.crosshair_color,
+                     (self.crosshair_x, self.chart_y, 1, self.chart_height + 1))
         
         # Draw crosshair center
         pygame.draw.circle(surface, (255, 255, 255), 
@@ -515,17 +582,13 @@ class OptimizedCryptoChart:
                          (self.crosshair_x, self.crosshair_y), 2)
         
         # Draw "+" symbol at crosshair (smaller)
-        pygame.draw.line(surface, (255, 255, 255),
-                        (self.crosshair_x - 3, self.crosshair_y),
-                        (self.crosshair_x + 3, self.crosshair_y), 1)
-        pygame.draw.line(surface, (255, 255, 255),
-                        (self.crosshair_x, self.crosshair_y - 3),
-                        (self.crosshair_x, self.crosshair_y + 3), 1)
+        surface.fill((255, 255, 255), (self.crosshair_x - 3, self.crosshair_y, 7, 1))
+        surface.fill((255, 255, 255), (self.crosshair_x, self.crosshair_y - 3, 1, 7))
         
         # Y-axis value (price)
         price = self.get_price_from_y(self.crosshair_y)
         price_text = f"${price:.2f}"
-        price_surface = self.font_tiny.render(price_text, True, (255, 255, 255))
+        price_surface = render_text(self.font_tiny, price_text, (255, 255, 255))
         
         # Price label background
         price_bg_rect = pygame.Rect(self.chart_x - 52, self.crosshair_y - 10, 
@@ -544,7 +607,7 @@ class OptimizedCryptoChart:
             else:
                 time_text = timestamp.strftime("%d/%m")
             
-            time_surface = self.font_tiny.render(time_text, True, (255, 255, 255))
+            time_surface = render_text(self.font_tiny, time_text, (255, 255, 255))
             
             # Time label background
             time_bg_rect = pygame.Rect(self.crosshair_x - 30, 
@@ -556,28 +619,18 @@ class OptimizedCryptoChart:
             time_rect = time_surface.get_rect(center=time_bg_rect.center)
             surface.blit(time_surface, time_rect)
     
-    def draw_interactive_points(self, surface: pygame.Surface):
+    def draw_interactive_points(self, surface: pygame.Surface, bundle):
         """Draw hover and pinned points"""
         # Draw pinned point if exists
-        if self.pinned_point_data:
-            # Find current position of pinned data
-            for point in self.data_points:
-                if point['index'] == self.pinned_point_data['index']:
-                    x, y = self.get_chart_position(point['index'], point['price'])
-                    pygame.draw.circle(surface, (245, 158, 11), (x, y), 8, 2)
-                    pygame.draw.circle(surface, (245, 158, 11), (x, y), 4)
-                    break
+        if self.pinned_index is not None and bundle is not None:
+            x, y = bundle[0], bundle[1]
+            pygame.draw.circle(surface, (245, 158, 11), (x, y), 8, 2)
+            pygame.draw.circle(surface, (245, 158, 11), (x, y), 4)
     
     def draw_sidebar(self, surface: pygame.Surface, coin_data: dict):
         """Draw compact market data sidebar"""
-        # Sidebar background
-        sidebar_rect = pygame.Rect(self.sidebar_x, self.chart_y, self.sidebar_width, self.chart_height)
-        pygame.draw.rect(surface, (31, 41, 55), sidebar_rect, border_radius=6)
-        pygame.draw.rect(surface, (55, 65, 81), sidebar_rect, 1, border_radius=6)
-        
-        # Title
-        title_surface = self.font_medium.render("MARKET DATA", True, (255, 255, 255))
-        surface.blit(title_surface, (self.sidebar_x + 15, self.chart_y + 15))
+        # Sidebar background (title is baked in)
+        blit_seq = [(self._sidebar_bg, (self.sidebar_x, self.chart_y))]
         
         # Market stats
         stats = [
@@ -592,8 +645,8 @@ class OptimizedCryptoChart:
             current_y = y_offset + i * 45
             
             # Label
-            label_surface = self.font_tiny.render(label, True, self.text_color)
-            surface.blit(label_surface, (self.sidebar_x + 15, current_y))
+            label_surface = render_text(self.font_tiny, label, self.text_color)
+            blit_seq.append((label_surface, (self.sidebar_x + 15, current_y)))
             
             # Value
             if "Market Cap" in label:
@@ -605,16 +658,24 @@ class OptimizedCryptoChart:
             else:
                 color = (156, 163, 175)
             
-            value_surface = self.font_small.render(str(value), True, color)
-            surface.blit(value_surface, (self.sidebar_x + 15, current_y + 14))
+            value_surface = render_text(self.font_small, str(value), color)
+            blit_seq.append((value_surface, (self.sidebar_x + 15, current_y + 14)))
+        
+        fblits(surface, blit_seq)
     
-    def draw_tooltip(self, surface: pygame.Surface, mouse_pos: Tuple[int, int]):
-        """Draw enhanced tooltip"""
-        point = self.pinned_point_data or self.hovered_point
-        if not point:
-            return
+    def _build_hover_render_bundle(self) -> Optional[Tuple[int, int, str, str, str, str, Tuple[int, int, int]]]:
+        """Screen position and formatted strings for the pinned/hovered point
+        
+        Returns (x, y, price_text, time_text, volume_text, change_text, change_color).
+        Memoized per point so the overlay draws share one formatting pass.
+        """
+        index = self.pinned_index if self.pinned_index is not None else self.hovered_index
+        if index is None:
+            return None
+        if index == self._hover_bundle_index:
+            return self._hover_bundle
         
-        # Tooltip content
+        point = self.data_points[index]
         price_text = f"${point['price']:.2f}"
         
         if self.time_range == '1D':
@@ -636,20 +697,32 @@ class OptimizedCryptoChart:
         
         # Calculate change
         change_text = ""
-        if point['index'] > 0:
-            prev_point = self.data_points[point['index'] - 1]
+        change_color = (239, 68, 68)
+        if index > 0:
+            prev_point = self.data_points[index - 1]
             change = ((point['price'] - prev_point['price']) / prev_point['price']) * 100
             change_text = f"{change:+.2f}%"
+            if change_text.startswith('+'):
+                change_color = (34, 197, 94)
+        
+        self._hover_bundle_index = index
+        self._hover_bundle = (self._xs[index], self._ys[index], price_text, time_text,
+                              volume_text, change_text, change_color)
+        return self._hover_bundle
+    
+    def draw_tooltip(self, surface: pygame.Surface, mouse_pos: Tuple[int, int], bundle):
+        """Draw enhanced tooltip"""
+        if bundle is None:
+            return
+        pinned = self.pinned_index is not None
+        px, py, price_text, time_text, volume_text, change_text, change_color = bundle
         
         padding = 10
         tooltip_width = 120
         tooltip_height = 70 if change_text else 55
         
         # Position tooltip
-        if self.pinned_point_data:
-            # Find screen position of pinned point
-            px, py = self.get_chart_position(self.pinned_point_data['index'], 
-                                            self.pinned_point_data['price'])
+        if pinned:
             tooltip_x = px + 15
             tooltip_y = py - tooltip_height - 5
         else:
@@ -660,46 +733,61 @@ class OptimizedCryptoChart:
         tooltip_x = max(5, min(tooltip_x, self.width - tooltip_width - 5))
         tooltip_y = max(5, min(tooltip_y, self.height - tooltip_height - 5))
         
+        # Redraw the tooltip sprite only when the shown point changes
+        if bundle is not self._tooltip_bundle or pinned != self._tooltip_pinned:
+            self._render_tooltip_sprite(bundle, pinned, tooltip_width, tooltip_height, padding)
+        surface.blit(self._tooltip_surf, (tooltip_x, tooltip_y))
+    
+    def _render_tooltip_sprite(self, bundle, pinned: bool, tooltip_width: int,
+                               tooltip_height: int, padding: int):
+        """Draw tooltip chrome and text into the persistent tooltip surface"""
+        _, _, price_text, time_text, volume_text, change_text, change_color = bundle
+        tooltip = self._tooltip_surf
+        tooltip.fill((0, 0, 0, 0))
+        
         # Background
-        bg_color = (45, 55, 72) if self.pinned_point_data else (31, 41, 55)
-        border_color = (245, 158, 11) if self.pinned_point_data else (107, 114, 128)
+        bg_color = (45, 55, 72) if pinned else (31, 41, 55)
+        border_color = (245, 158, 11) if pinned else (107, 114, 128)
         
-        pygame.draw.rect(surface, bg_color, 
-                        (tooltip_x, tooltip_y, tooltip_width, tooltip_height), border_radius=6)
-        pygame.draw.rect(surface, border_color, 
-                        (tooltip_x, tooltip_y, tooltip_width, tooltip_height), 1, border_radius=6)
+        pygame.draw.rect(tooltip, bg_color, 
+                        (0, 0, tooltip_width, tooltip_height), border_radius=6)
+        pygame.draw.rect(tooltip, border_color, 
+                        (0, 0, tooltip_width, tooltip_height), 1, border_radius=6)
         
         # Content
-        y_offset = tooltip_y + padding
+        y_offset = padding
         
         # Price
-        price_surface = self.font_medium.render(price_text, True, (255, 255, 255))
-        surface.blit(price_surface, (tooltip_x + padding, y_offset))
+        price_surface = render_text(self.font_medium, price_text, (255, 255, 255))
+        tooltip.blit(price_surface, (padding, y_offset))
         y_offset += 16
         
         # Time
-        time_surface = self.font_tiny.render(time_text, True, self.text_color)
-        surface.blit(time_surface, (tooltip_x + padding, y_offset))
+        time_surface = render_text(self.font_tiny, time_text, self.text_color)
+        tooltip.blit(time_surface, (padding, y_offset))
         y_offset += 13
         
         # Volume
-        volume_surface = self.font_tiny.render(volume_text, True, (156, 163, 175))
-        surface.blit(volume_surface, (tooltip_x + padding, y_offset))
+        volume_surface = render_text(self.font_tiny, volume_text, (156, 163, 175))
+        tooltip.blit(volume_surface, (padding, y_offset))
         
         # Change
         if change_text:
             y_offset += 13
-            change_color = (34, 197, 94) if change_text.startswith('+') else (239, 68, 68)
-            change_surface = self.font_tiny.render(change_text, True, change_color)
-            surface.blit(change_surface, (tooltip_x + padding, y_offset))
+            change_surface = render_text(self.font_tiny, change_text, change_color)
+            tooltip.blit(change_surface, (padding, y_offset))
         
         # Pin indicator
-        if self.pinned_point_data:
-            pin_surface = self.font_tiny.render("📌", True, (245, 158, 11))
-            surface.blit(pin_surface, (tooltip_x + tooltip_width - 20, tooltip_y + 3))
+        if pinned:
+            pin_surface = render_text(self.font_tiny, "📌", (245, 158, 11))
+            tooltip.blit(pin_surface, (tooltip_width - 20, 3))
+        
+        self._tooltip_bundle = bundle
+        self._tooltip_pinned = pinned
     
     def render(self, surface: pygame.Surface, mouse_pos: Tuple[int, int], coin_data: dict):
         """Main render method"""
+        hover_bundle = self._build_hover_render_bundle()
         surface.fill(self.bg_color)
         
         self.draw_header(surface, coin_data)
@@ -707,9 +795,9 @@ class OptimizedCryptoChart:
         self.draw_grid(surface)
         self.draw_chart_line(surface)
         self.draw_crosshair_with_values(surface)
-        self.draw_interactive_points(surface)
+        self.draw_interactive_points(surface, hover_bundle)
         self.draw_sidebar(surface, coin_data)
-        self.draw_tooltip(surface, mouse_pos)
+        self.draw_tooltip(surface, mouse_pos, hover_bundle)
 
 class OptimizedCryptoModal:
     """Optimized modal with fixed size and better performance"""
@@ -727,6 +815,12 @@ class OptimizedCryptoModal:
         
         self.chart = OptimizedCryptoChart(self.width, self.height)
         
+        # Persistent surfaces: dimming overlay and last rendered chart frame
+        self._overlay = pygame.Surface(screen_size, pygame.SRCALPHA)
+        self._overlay.fill((0, 0, 0, 180))
+        self._modal_surface = pygame.Surface((self.width, self.height))
+        self._dirty = True
+        
     def handle_click(self, pos: tuple) -> bool:
         if not self.is_active:
             return False
@@ -744,15 +838,18 @@ class OptimizedCryptoModal:
                 self.close()
                 return True
         
+        self._dirty = True
         return self.chart.handle_click(relative_pos)
     
     def handle_mouse_move(self, pos: tuple):
         if self.is_active:
             relative_pos = (pos[0] - self.x, pos[1] - self.y)
             self.chart.handle_mouse_move(relative_pos)
+            self._dirty = True
     
     def open(self):
         self.is_active = True
+        self._dirty = True
         
     def close(self):
         self.is_active = False
@@ -765,19 +862,17 @@ class OptimizedCryptoModal:
             return
             
         # Semi-transparent overlay
-        overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
-        
-        # Modal background
-        modal_surface = pygame.Surface((self.width, self.height))
-        mouse_pos = pygame.mouse.get_pos()
-        relative_mouse = (mouse_pos[0] - self.x, mouse_pos[1] - self.y)
+        surface.blit(self._overlay, (0, 0))
         
-        self.chart.render(modal_surface, relative_mouse, self.coin_data)
+        # Modal background (re-rendered only after input changed it)
+        if self._dirty:
+            mouse_pos = pygame.mouse.get_pos()
+            relative_mouse = (mouse_pos[0] - self.x, mouse_pos[1] - self.y)
+            self.chart.render(self._modal_surface, relative_mouse, self.coin_data)
+            self._dirty = False
         
         # Draw modal with border
-        surface.blit(modal_surface, (self.x, self.y))
+        surface.blit(self._modal_surface, (self.x, self.y))
         pygame.draw.rect(surface, (60, 80, 110), 
                         (self.x-1, self.y-1, self.width+2, self.height+2), 2)
 
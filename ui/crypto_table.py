@@ -4,10 +4,12 @@ Cryptocurrency table component with reduced font sizes
 
 import pygame
 import time
-import os
 from config.settings import COLORS, FONT_SIZES
-from utils.rank_tracker import get_daily_rank_change
-from utils.formatters import format_large_number, format_supply, format_price
+from utils.rank_tracker import get_daily_rank_changes, get_rank_version
+from utils.formatters import format_large_numbers, format_prices
+from utils.render_cache import get_font, render_text, fblits
+from utils.logo_loader import get_logo_surface, get_logo_version
+from data.crypto_api import build_crypto_soa, get_crypto_soa
 
 class CryptoTable:
     """Enhanced table with daily rank tracking and smaller fonts"""
@@ -18,6 +20,23 @@ class CryptoTable:
         self.last_page_switch = time.time()
         self.page_switch_interval = 10
         self.headers = ["#", "Coin", "Price", "Market Cap", "24h Change", "Volume"]
+        
+        # Static table chrome keyed by (width, height, row_height, visible_rows)
+        self._chrome_cache = {}
+        
+        # What the target surface currently shows, to skip identical redraws
+        self._drawn_key = None
+        
+        # Formatted columns of the current page, rebuilt only on page flip
+        # or data reload
+        self.rows_per_page = None
+        self._visible_columns = None
+        self._visible_key = None
+        
+        # {symbol: (rank_change, indicator)} for every coin, refreshed when
+        # the data or the rank tracking changes
+        self._rank_cache = {}
+        self._rank_key = None
     
     def calculate_optimal_layout(self, available_height):
         """Calculate optimal layout"""
@@ -49,9 +68,47 @@ class CryptoTable:
         
         return best_config[0], best_config[1], header_height
     
-    def update(self):
-        """Update table pagination"""
-        pass
+    def _get_chrome(self, size, col_positions, header_height, row_height, visible_rows, header_font):
+        """Get the pre-rendered panel background, header row and row bands"""
+        key = (size, row_height, visible_rows)
+        chrome = self._chrome_cache.get(key)
+        if chrome is not None:
+            return chrome
+        
+        # Entries for a previous panel size will not be used again
+        if any(cached_key[0] != size for cached_key in self._chrome_cache):
+            self._chrome_cache.clear()
+        
+        width = size[0]
+        chrome = pygame.Surface(size)
+        chrome.fill(COLORS['panel_bg'])
+        
+        # Header
+        header_rect = pygame.Rect(0, 0, width, header_height)
+        pygame.draw.rect(chrome, (30, 30, 40), header_rect)
+        
+        for i, header in enumerate(self.headers):
+            text_surface = render_text(header_font, header, (220, 220, 220))
+            chrome.blit(text_surface, (col_positions[i] + 8, 6))
+        
+        pygame.draw.line(chrome, (60, 60, 80), (0, header_height), (width, header_height), 2)
+        
+        # Alternating row bands
+        for i in range(visible_rows):
+            y = header_height + i * row_height
+            row_color = (20, 20, 25) if i % 2 == 0 else (25, 25, 30)
+            pygame.draw.rect(chrome, row_color, pygame.Rect(0, y, width, row_height))
+        
+        self._chrome_cache[key] = chrome
+        return chrome
+    
+    def update(self, total_items=None):
+        """Update table pagination
+        
+        Pagination needs rows_per_page, which is known after the first draw.
+        """
+        if total_items and self.rows_per_page:
+            self.update_pagination(total_items, self.rows_per_page)
     
     def update_pagination(self, total_items, rows_per_page):
         """Update pagination logic"""
@@ -63,20 +120,55 @@ class CryptoTable:
                 self.current_page = 0
             self.last_page_switch = now
     
-    def draw(self, surface, crypto_data):
-        """Draw the cryptocurrency table with smaller fonts"""
-        surface.fill(COLORS['panel_bg'])
+    def _build_visible_columns(self, crypto_data, data_version, start_idx, rows_per_page):
+        """Slice one page out of the column arrays and format its cells"""
+        soa = get_crypto_soa() if data_version is not None else None
+        if soa is None or soa['version'] != data_version:
+            soa = build_crypto_soa(crypto_data[start_idx:start_idx + rows_per_page])
+            start_idx = 0
+        end_idx = start_idx + rows_per_page
+        
+        symbols = soa['symbol'][start_idx:end_idx]
+        price_texts = format_prices(soa['price'][start_idx:end_idx])
+        mc_texts = format_large_numbers(soa['market_cap'][start_idx:end_idx])
+        vol_texts = format_large_numbers(soa['volume'][start_idx:end_idx])
+        changes_24h = soa['change_24h'][start_idx:end_idx].tolist()
+        return symbols, price_texts, mc_texts, vol_texts, changes_24h
+    
+    def draw(self, surface, crypto_data, data_version=None):
+        """Draw the cryptocurrency table with smaller fonts
         
+        When data_version is given and neither it, the page nor the surface
+        changed since the last call, the surface already holds this frame.
+        Returns True if the surface was redrawn.
+        """
         if not crypto_data:
-            font = pygame.font.SysFont("Arial", 16, bold=True)
-            loading_surface = font.render("Loading cryptocurrency data...", True, COLORS['neutral'])
+            self._drawn_key = None
+            surface.fill(COLORS['panel_bg'])
+            font = get_font("Arial", 16, bold=True)
+            loading_surface = render_text(font, "Loading cryptocurrency data...", COLORS['neutral'])
             surface.blit(loading_surface, (10, 50))
-            return
+            return True
         
         width, height = surface.get_size()
         rows_per_page, row_height, header_height = self.calculate_optimal_layout(height)
         
-        self.update_pagination(len(crypto_data), rows_per_page)
+        self.rows_per_page = rows_per_page
+        if self.current_page * rows_per_page >= len(crypto_data):
+            self.current_page = 0
+        
+        rank_key = (data_version, get_rank_version())
+        if data_version is None or rank_key != self._rank_key:
+            self._rank_cache = get_daily_rank_changes([coin['symbol'].upper() for coin in crypto_data])
+            self._rank_key = rank_key
+        
+        if data_version is not None:
+            draw_key = (rank_key, get_logo_version(), self.current_page, id(surface), surface.get_size())
+            if draw_key == self._drawn_key:
+                return False
+            self._drawn_key = draw_key
+        else:
+            self._drawn_key = None
         
         # Column widths
         col_widths = [0.15, 0.22, 0.18, 0.18, 0.15, 0.12]
@@ -92,51 +184,51 @@ class CryptoTable:
         rank_font_size = min(16, max(12, row_height // 3 + 1))
         change_font_size = min(14, max(10, row_height // 4))
         
-        header_font = pygame.font.SysFont("Arial", header_font_size, bold=True)
-        data_font = pygame.font.SysFont("Arial", data_font_size, bold=True)
-        rank_font = pygame.font.SysFont("Arial", rank_font_size, bold=True)
-        change_font = pygame.font.SysFont("Arial", change_font_size, bold=True)
-        
-        # Draw header
-        header_rect = pygame.Rect(0, 0, width, header_height)
-        pygame.draw.rect(surface, (30, 30, 40), header_rect)
-        
-        for i, header in enumerate(self.headers):
-            text_surface = header_font.render(header, True, (220, 220, 220))
-            surface.blit(text_surface, (col_positions[i] + 8, 6))
-        
-        pygame.draw.line(surface, (60, 60, 80), (0, header_height), (width, header_height), 2)
+        header_font = get_font("Arial", header_font_size, bold=True)
+        data_font = get_font("Arial", data_font_size, bold=True)
+        rank_font = get_font("Arial", rank_font_size, bold=True)
+        change_font = get_font("Arial", change_font_size, bold=True)
         
         # Calculate visible rows
         start_idx = self.current_page * rows_per_page
-        end_idx = min(start_idx + rows_per_page, len(crypto_data))
-        visible_data = crypto_data[start_idx:end_idx]
+        visible_key = (data_version, self.current_page, rows_per_page)
+        if data_version is None or visible_key != self._visible_key:
+            self._visible_columns = self._build_visible_columns(crypto_data, data_version,
+                                                                start_idx, rows_per_page)
+            self._visible_key = visible_key
+        symbols, price_texts, mc_texts, vol_texts, changes_24h = self._visible_columns
+        
+        # Static chrome (background, header, row bands) in a single blit; all
+        # cell text and logos are collected and issued in one batch at the end
+        chrome = self._get_chrome((width, height), col_positions, header_height,
+                                  row_height, len(symbols), header_font)
+        surface.blit(chrome, (0, 0))
+        blit_seq = []
+        
+        # Per-frame constants for the row loop
+        rank_x = col_positions[0] + 8
+        price_x = col_positions[2] + 8
+        mc_x = col_positions[3] + 8
+        change_col_x = col_positions[4] + 8
+        vol_x = col_positions[5] + 8
+        logo_size = min(24, row_height - 4)
+        logo_offset = (row_height - logo_size) // 2
         
         # Draw data rows
-        for i, coin in enumerate(visible_data):
+        for i, symbol in enumerate(symbols):
             y = header_height + i * row_height
             
-            if i % 2 == 0:
-                row_color = (20, 20, 25)
-            else:
-                row_color = (25, 25, 30)
-            
-            row_rect = pygame.Rect(0, y, width, row_height)
-            pygame.draw.rect(surface, row_color, row_rect)
-            
             text_center_y = y + row_height // 2
             
             # Rank column with daily change
             current_rank = start_idx + i + 1
-            symbol = coin['symbol'].upper()
             
-            rank_change, change_indicator = get_daily_rank_change(symbol)
+            rank_change, change_indicator = self._rank_cache.get(symbol, (0, ""))
             
             rank_text = str(current_rank)
-            rank_surface = rank_font.render(rank_text, True, (220, 220, 220))
-            rank_x = col_positions[0] + 8
+            rank_surface = render_text(rank_font, rank_text, (220, 220, 220))
             rank_y = text_center_y - rank_surface.get_height() // 2
-            surface.blit(rank_surface, (rank_x, rank_y))
+            blit_seq.append((rank_surface, (rank_x, rank_y)))
             
             if change_indicator and change_indicator != "–":
                 change_x = rank_x + rank_surface.get_width() + 6
@@ -148,62 +240,55 @@ class CryptoTable:
                 else:
                     change_color = COLORS['neutral']
                 
-                change_surface = change_font.render(change_indicator, True, change_color)
+                change_surface = render_text(change_font, change_indicator, change_color)
                 change_y = text_center_y - change_surface.get_height() // 2
-                surface.blit(change_surface, (change_x, change_y))
+                blit_seq.append((change_surface, (change_x, change_y)))
             
             # Coin column with logo
-            logo_path = f"assets/logos/{symbol.lower()}.png"
             coin_x = col_positions[1] + 8
-            logo_size = min(24, row_height - 4)
             
-            if os.path.exists(logo_path):
-                try:
-                    logo = pygame.image.load(logo_path).convert_alpha()
-                    logo = pygame.transform.smoothscale(logo, (logo_size, logo_size))
-                    logo_y = y + (row_height - logo_size) // 2
-                    surface.blit(logo, (coin_x, logo_y))
-                    coin_x += logo_size + 6
-                except:
-                    pass
+            logo = get_logo_surface(symbol, logo_size)
+            if logo:
+                blit_seq.append((logo, (coin_x, y + logo_offset)))
+                coin_x += logo_size + 6
             
-            symbol_surface = data_font.render(symbol, True, (200, 200, 200))
+            symbol_surface = render_text(data_font, symbol, (200, 200, 200))
             symbol_y = text_center_y - symbol_surface.get_height() // 2
-            surface.blit(symbol_surface, (coin_x, symbol_y))
+            blit_seq.append((symbol_surface, (coin_x, symbol_y)))
             
             # Price column
-            price_text = format_price(coin.get('current_price', 0))
-            price_surface = data_font.render(price_text, True, (180, 180, 180))
+            price_surface = render_text(data_font, price_texts[i], (180, 180, 180))
             price_y = text_center_y - price_surface.get_height() // 2
-            surface.blit(price_surface, (col_positions[2] + 8, price_y))
+            blit_seq.append((price_surface, (price_x, price_y)))
             
             # Market cap column
-            mc_text = format_large_number(coin.get('market_cap', 0))
-            mc_surface = data_font.render(mc_text, True, (180, 180, 180))
+            mc_surface = render_text(data_font, mc_texts[i], (180, 180, 180))
             mc_y = text_center_y - mc_surface.get_height() // 2
-            surface.blit(mc_surface, (col_positions[3] + 8, mc_y))
+            blit_seq.append((mc_surface, (mc_x, mc_y)))
             
             # 24h change column
-            change_24h = coin.get('price_change_percentage_24h', 0) or 0
+            change_24h = changes_24h[i]
             change_color = COLORS['positive'] if change_24h >= 0 else COLORS['negative']
             change_text = f"{change_24h:+.2f}%"
             
-            change_surface = data_font.render(change_text, True, change_color)
+            change_surface = render_text(data_font, change_text, change_color)
             change_y = text_center_y - change_surface.get_height() // 2
-            surface.blit(change_surface, (col_positions[4] + 8, change_y))
+            blit_seq.append((change_surface, (change_col_x, change_y)))
             
             # Volume column
-            vol_text = format_large_number(coin.get('total_volume', 0))
-            vol_surface = data_font.render(vol_text, True, (180, 180, 180))
+            vol_surface = render_text(data_font, vol_texts[i], (180, 180, 180))
             vol_y = text_center_y - vol_surface.get_height() // 2
-            surface.blit(vol_surface, (col_positions[5] + 8, vol_y))
+            blit_seq.append((vol_surface, (vol_x, vol_y)))
         
         # Pagination info
         total_pages = max(1, (len(crypto_data) + rows_per_page - 1) // rows_per_page)
         page_info = f"Page {self.current_page + 1} of {total_pages} • {rows_per_page} rows • {len(crypto_data)} cryptocurrencies"
         
-        page_font = pygame.font.SysFont("Arial", max(10, data_font_size - 3))
-        page_surface = page_font.render(page_info, True, COLORS['neutral'])
+        page_font = get_font("Arial", max(10, data_font_size - 3))
+        page_surface = render_text(page_font, page_info, COLORS['neutral'])
         
         page_y = height - 18
-        surface.blit(page_surface, (width - page_surface.get_width() - 10, page_y))
\ No newline at end of file
+        blit_seq.append((page_surface, (width - page_surface.get_width() - 10, page_y)))
+        
+        fblits(surface, blit_seq)
+        return True
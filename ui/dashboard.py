@@ -6,11 +6,13 @@ Includes last update timestamp and real-time Berlin timezone clock
 import pygame
 import time
 import datetime
+import calendar
 # Removed pytz dependency - using manual timezone offset
 from config.settings import *
 from data.crypto_api import (
     fetch_crypto_data, fetch_crypto_news, fetch_fear_greed_index,
-    get_crypto_data, get_news_data, get_fear_greed_data
+    get_crypto_data, get_crypto_data_with_version, get_crypto_count,
+    get_news_data, get_fear_greed_data, get_data_version, mark_data_updated
 )
 from ui.crypto_table import CryptoTable
 from ui.news_panel import draw_news_panel
@@ -21,6 +23,7 @@ from utils.data_loader import (
 )
 from utils.rank_tracker import update_daily_rank_tracking
 from utils.logo_loader import preload_top_logos
+from utils.render_cache import get_font, fblits
 from threading import Thread
 
 
@@ -31,6 +34,37 @@ class TimestampManager:
         self.last_crypto_update = None
         self.last_news_update = None
         self.last_fear_greed_update = None
+        
+        # DST boundaries only change once a year; all kept as UTC epoch seconds
+        self._dst_year = None
+        self._year_start = None
+        self._year_end = None
+        self._dst_start = None
+        self._dst_end = None
+    
+    def _update_dst_bounds(self, year):
+        """Calculate the Central European DST window for a year
+        
+        The window runs from midnight UTC on the last Sunday in March to
+        midnight UTC on the last Sunday in October.
+        """
+        # Calculate DST start (last Sunday in March)
+        march_31 = datetime.datetime(year, 3, 31)
+        dst_start = march_31 - datetime.timedelta(days=march_31.weekday() + 1)
+        if dst_start.day < 25:
+            dst_start += datetime.timedelta(days=7)
+        
+        # Calculate DST end (last Sunday in October) 
+        oct_31 = datetime.datetime(year, 10, 31)
+        dst_end = oct_31 - datetime.timedelta(days=oct_31.weekday() + 1)
+        if dst_end.day < 25:
+            dst_end += datetime.timedelta(days=7)
+        
+        self._dst_year = year
+        self._year_start = calendar.timegm((year, 1, 1, 0, 0, 0))
+        self._year_end = calendar.timegm((year + 1, 1, 1, 0, 0, 0))
+        self._dst_start = calendar.timegm(dst_start.timetuple())
+        self._dst_end = calendar.timegm(dst_end.timetuple())
     
     def update_crypto_timestamp(self):
         """Update crypto data timestamp"""
@@ -64,36 +98,30 @@ class TimestampManager:
         
         return f"Last updated: {update_time.strftime('%H:%M')}"
     
-    def get_berlin_time_text(self):
-        """Get formatted Berlin time using UTC offset"""
+    def get_berlin_time_text(self, now=None):
+        """Get formatted Berlin time using UTC offset
+        
+        now is a UTC epoch timestamp and defaults to the current time.
+        """
         try:
             # Berlin is UTC+1 (CET) or UTC+2 (CEST during DST)
-            utc_time = datetime.datetime.utcnow()
+            utc_seconds = int(time.time() if now is None else now)
             
             # Simple DST calculation for Central Europe
             # DST: Last Sunday in March to last Sunday in October
-            year = utc_time.year
-            
-            # Calculate DST start (last Sunday in March)
-            march_31 = datetime.datetime(year, 3, 31)
-            dst_start = march_31 - datetime.timedelta(days=march_31.weekday() + 1)
-            if dst_start.day < 25:
-                dst_start += datetime.timedelta(days=7)
-            
-            # Calculate DST end (last Sunday in October) 
-            oct_31 = datetime.datetime(year, 10, 31)
-            dst_end = oct_31 - datetime.timedelta(days=oct_31.weekday() + 1)
-            if dst_end.day < 25:
-                dst_end += datetime.timedelta(days=7)
+            if self._dst_year is None or not self._year_start <= utc_seconds < self._year_end:
+                self._update_dst_bounds(time.gmtime(utc_seconds).tm_year)
             
             # Determine offset (UTC+1 or UTC+2)
-            if dst_start <= utc_time.replace(tzinfo=None) < dst_end:
+            if self._dst_start <= utc_seconds < self._dst_end:
                 offset_hours = 2  # CEST (UTC+2)
             else:
                 offset_hours = 1  # CET (UTC+1)
             
-            berlin_time = utc_time + datetime.timedelta(hours=offset_hours)
-            return f"Berlin Time: {berlin_time.strftime('%H:%M:%S')}"
+            # Only HH:MM:SS is shown, so plain integer arithmetic is enough
+            minutes, seconds = divmod(utc_seconds + offset_hours * 3600, 60)
+            hours, minutes = divmod(minutes, 60)
+            return f"Berlin Time: {hours % 24:02d}:{minutes:02d}:{seconds:02d}"
             
         except:
             # Simple fallback to UTC+1
@@ -101,6 +129,17 @@ class TimestampManager:
             berlin_time = utc_time + datetime.timedelta(hours=1)
             return f"Berlin Time: {berlin_time.strftime('%H:%M:%S')} (CET)"
 
+def create_panel_surface(size):
+    """Create an opaque panel buffer in the display's pixel format
+    
+    Panels paint their own background, so they need no alpha; matching the
+    display format keeps the per-frame panel blits on SDL's fast copy path.
+    """
+    panel_surface = pygame.Surface(size)
+    if pygame.display.get_surface() is not None:
+        panel_surface = panel_surface.convert()
+    return panel_surface
+
 class EnhancedDashboard:
     """Enhanced dashboard with timestamps and refined UI"""
     
@@ -111,17 +150,57 @@ class EnhancedDashboard:
         self.current_layout_areas = None
         self.layout_update_needed = False
         
+        # Panel surfaces allocated in get_layout_areas; each is redrawn only
+        # when its data version (or the table page) changes
+        self._table_surface = None
+        self._news_surface = None
+        self._news_key = None
+        self._fear_surface = None
+        self._fear_key = None
+        self._panel_blits = []
+        self._divider_segments = ()
+        
+        # Dirty tracking for the adaptive frame rate: data changes and input
+        # keep the full rate, IDLE_FPS applies once nothing changed for a while
+        self._dirty = True
+        self._last_dirty_time = time.time()
+        self._rendered_versions = None
+        
+        # Screen rects changed by the last render, for display.update; the
+        # first frame after a layout change covers the whole screen
+        self._full_redraw = True
+        self._clock_rect = None
+        self._clock_drawn_second = None
+        
+        # Berlin clock sprites, re-rendered once per wall-clock second
+        self._clock_second = None
+        self._clock_surface = None
+        self._clock_bg = None
+        
     def load_initial_data(self):
-        """Load initial data for the dashboard"""
+        """Load initial data for the dashboard
+        
+        The three fetches are independent network requests, each stored
+        under its own lock, so they run in parallel threads.
+        """
         print("Loading initial data...")
         
-        # Load crypto data first
+        loaders = [Thread(target=loader, daemon=True)
+                   for loader in (self._load_crypto, self._load_news, self._load_fear_greed)]
+        for loader in loaders:
+            loader.start()
+        for loader in loaders:
+            loader.join()
+    
+    def _load_crypto(self):
+        """Fetch and store the initial crypto data"""
         initial_data = fetch_crypto_data()
         if initial_data:
             with data_lock:
                 from data.crypto_api import crypto_data
                 crypto_data.clear()
                 crypto_data.extend(initial_data)
+                mark_data_updated('crypto')
             
             update_daily_rank_tracking(initial_data)
             update_loading_state('crypto_data', True)
@@ -130,20 +209,23 @@ class EnhancedDashboard:
             
             # Start logo preloading
             Thread(target=preload_top_logos, args=(initial_data, 50), daemon=True).start()
-        
-        # Load news data
+    
+    def _load_news(self):
+        """Fetch and store the initial news"""
         initial_news = fetch_crypto_news()
         if initial_news:
             with news_lock:
                 from data.crypto_api import news_list
                 news_list.clear()
                 news_list.extend(initial_news)
+                mark_data_updated('news')
             
             update_loading_state('news_data', True)
             self.timestamp_manager.update_news_timestamp()
             print(f"Loaded {len(initial_news)} news articles")
-        
-        # Load fear & greed data
+    
+    def _load_fear_greed(self):
+        """Fetch and store the initial Fear & Greed Index"""
         initial_fear_greed = fetch_fear_greed_index()
         if initial_fear_greed:
             with fear_greed_lock:
@@ -159,6 +241,7 @@ class EnhancedDashboard:
                     'trend_30d': initial_fear_greed['trend_30d'],
                     'last_updated': time.time()
                 })
+                mark_data_updated('fear_greed')
             
             update_loading_state('fear_greed_data', True)
             self.timestamp_manager.update_fear_greed_timestamp()
@@ -176,126 +259,182 @@ class EnhancedDashboard:
         """Force layout update for screen size changes"""
         self.layout_update_needed = True
         self.current_layout_areas = None
+        self.mark_dirty()
         print("Dashboard layout update requested")
     
+    def mark_dirty(self):
+        """Record that something on screen changed (new data, user input)"""
+        self._dirty = True
+        self._last_dirty_time = time.time()
+    
+    @property
+    def desired_fps(self):
+        """FPS while something changed recently, IDLE_FPS once idle"""
+        if self._dirty or time.time() - self._last_dirty_time < IDLE_AFTER_SECONDS:
+            return FPS
+        return IDLE_FPS
+    
     def get_crypto_data(self):
         """Get current cryptocurrency data"""
         return get_crypto_data()
     
     def get_layout_areas(self, screen_size):
         """Calculate layout areas for different components"""
+        layout_areas = self.current_layout_areas
+        if (layout_areas is not None and not self.layout_update_needed and
+                layout_areas['screen_size'] == screen_size):
+            return layout_areas
+        
         width, height = screen_size
+        bubble_width = int(width * LAYOUT['bubble_width_ratio'])
+        bubble_height = int(height * LAYOUT['bubble_height_ratio'])
+        news_width = int(width * LAYOUT['news_width_ratio'])
+        news_height = int(height * LAYOUT['news_height_ratio'])
         
-        # Update layout if needed
-        if (self.current_layout_areas is None or 
-            self.layout_update_needed or
-            (self.current_layout_areas and 
-             self.current_layout_areas.get('screen_size') != screen_size)):
-            
-            self.current_layout_areas = {
-                'screen_size': screen_size,
-                'bubble_area': pygame.Rect(0, 0, 
-                                         int(width * LAYOUT['bubble_width_ratio']), 
-                                         int(height * LAYOUT['bubble_height_ratio'])),
-                'table_area': pygame.Rect(0, 
-                                        int(height * LAYOUT['bubble_height_ratio']), 
-                                        int(width * LAYOUT['bubble_width_ratio']), 
-                                        int(height * (1 - LAYOUT['bubble_height_ratio']))),
-                'news_area': pygame.Rect(int(width * LAYOUT['bubble_width_ratio']), 0, 
-                                       int(width * LAYOUT['news_width_ratio']), 
-                                       int(height * LAYOUT['news_height_ratio'])),
-                'fear_area': pygame.Rect(int(width * LAYOUT['bubble_width_ratio']), 
-                                       int(height * LAYOUT['news_height_ratio']), 
-                                       int(width * LAYOUT['news_width_ratio']), 
-                                       int(height * LAYOUT['fear_greed_height_ratio']))
-            }
-            
-            self.layout_update_needed = False
-            print(f"Layout updated for {screen_size}")
+        layout_areas = {
+            'screen_size': screen_size,
+            'bubble_area': pygame.Rect(0, 0, bubble_width, bubble_height),
+            'table_area': pygame.Rect(0, bubble_height, bubble_width,
+                                      int(height * (1 - LAYOUT['bubble_height_ratio']))),
+            'news_area': pygame.Rect(bubble_width, 0, news_width, news_height),
+            'fear_area': pygame.Rect(bubble_width, news_height, news_width,
+                                     int(height * LAYOUT['fear_greed_height_ratio']))
+        }
+        self.current_layout_areas = layout_areas
+        
+        # Panel buffers follow the layout; each child draw fills its own
+        # background, so the buffers are only reallocated here
+        self._table_surface = create_panel_surface(layout_areas['table_area'].size)
+        self._news_surface = create_panel_surface(layout_areas['news_area'].size)
+        self._news_key = None
+        self._fear_surface = create_panel_surface(layout_areas['fear_area'].size)
+        self._fear_key = None
+        self._panel_blits = [
+            (self._table_surface, layout_areas['table_area'].topleft),
+            (self._news_surface, layout_areas['news_area'].topleft),
+            (self._fear_surface, layout_areas['fear_area'].topleft)
+        ]
         
-        return self.current_layout_areas
+        # Divider endpoints: vertical, table separation, news/fear greed
+        news_area = layout_areas['news_area']
+        self._divider_segments = (
+            ((bubble_width, 0), (bubble_width, height)),
+            ((0, bubble_height), (bubble_width, bubble_height)),
+            ((news_area.left, news_area.bottom), (news_area.right, news_area.bottom))
+        )
+        self._full_redraw = True
+        
+        self.layout_update_needed = False
+        print(f"Layout updated for {screen_size}")
+        
+        return layout_areas
     
     def update(self):
         """Update dashboard components and timestamps"""
-        self.crypto_table.update()
+        self.crypto_table.update(get_crypto_count())
     
     def render(self, surface):
-        """Render all dashboard components with timestamps"""
+        """Render all dashboard components with timestamps
+        
+        Returns the list of screen rects whose pixels changed since the
+        previous call, for pygame.display.update.
+        """
         screen_size = surface.get_size()
         layout_areas = self.get_layout_areas(screen_size)
         
+        # Any data set changing since the last frame counts as activity
+        versions = (get_data_version('crypto'), get_data_version('news'), get_data_version('fear_greed'))
+        if versions != self._rendered_versions:
+            self._rendered_versions = versions
+            self.mark_dirty()
+        
         # Clear screen
         surface.fill(COLORS['background'])
         
-        # Render table
-        table_data = get_crypto_data()
-        table_surface = pygame.Surface(layout_areas['table_area'].size)
-        self.crypto_table.draw(table_surface, table_data)
-        surface.blit(table_surface, layout_areas['table_area'])
+        # Render table (the table skips redrawing when data and page are unchanged)
+        dirty_rects = []
+        table_data, table_version = get_crypto_data_with_version()
+        if self.crypto_table.draw(self._table_surface, table_data, table_version):
+            dirty_rects.append(layout_areas['table_area'])
         
         # Render news panel
-        news_data = get_news_data()
-        news_surface = pygame.Surface(layout_areas['news_area'].size)
-        draw_news_panel(news_surface, news_data)
-        surface.blit(news_surface, layout_areas['news_area'])
+        news_key = get_data_version('news')
+        if news_key != self._news_key:
+            draw_news_panel(self._news_surface, get_news_data())
+            self._news_key = news_key
+            dirty_rects.append(layout_areas['news_area'])
         
         # Render Fear & Greed Index
-        fear_greed_data = get_fear_greed_data()
-        fear_surface = pygame.Surface(layout_areas['fear_area'].size)
-        draw_fear_greed_chart(fear_surface, fear_greed_data)
-        surface.blit(fear_surface, layout_areas['fear_area'])
+        fear_key = get_data_version('fear_greed')
+        if fear_key != self._fear_key:
+            draw_fear_greed_chart(self._fear_surface, get_fear_greed_data())
+            self._fear_key = fear_key
+            dirty_rects.append(layout_areas['fear_area'])
+        
+        # Composite the three panels in one batch
+        fblits(surface, self._panel_blits)
         
         # Draw section dividers
         self.draw_dividers(surface, layout_areas)
         
         # ENHANCED: Render timestamps
-        self.render_timestamps(surface, screen_size)
+        dirty_rects.extend(self.render_timestamps(surface, screen_size))
+        self._dirty = False
+        
+        if self._full_redraw:
+            self._full_redraw = False
+            return [surface.get_rect()]
+        return dirty_rects
     
     def render_timestamps(self, surface, screen_size):
-        """Render Berlin clock only"""
+        """Render Berlin clock only, returning the rects changed since last frame"""
         width, height = screen_size
         
-        # Fonts
-        clock_font = pygame.font.SysFont("Segoe UI", 12, bold=True)
-        
-        # Colors
-        clock_color = (180, 200, 220)
-        
-        # Berlin clock (top-right)
-        berlin_time_text = self.timestamp_manager.get_berlin_time_text()
-        clock_surface = clock_font.render(berlin_time_text, True, clock_color)
+        # The clock shows whole seconds, so text and background only change once a second
+        current_second = int(time.time())
+        if current_second != self._clock_second:
+            # Fonts
+            clock_font = get_font("Segoe UI", 12, bold=True)
+            
+            # Colors
+            clock_color = (180, 200, 220)
+            
+            # Berlin clock (top-right); the text never repeats, so it is rendered
+            # directly instead of going through the shared render_text cache
+            berlin_time_text = self.timestamp_manager.get_berlin_time_text(current_second)
+            clock_surface = clock_font.render(berlin_time_text, True, clock_color)
+            
+            # Background for clock
+            bg_size = (clock_surface.get_width() + 12, clock_surface.get_height() + 6)
+            if self._clock_bg is None or self._clock_bg.get_size() != bg_size:
+                self._clock_bg = pygame.Surface(bg_size, pygame.SRCALPHA)
+                self._clock_bg.fill((25, 30, 40, 220))
+            
+            self._clock_surface = clock_surface
+            self._clock_second = current_second
         
+        clock_surface = self._clock_surface
         clock_x = width - clock_surface.get_width() - 15
         clock_y = 10
         
-        # Background for clock
-        clock_bg_width = clock_surface.get_width() + 12
-        clock_bg_height = clock_surface.get_height() + 6
-        clock_bg = pygame.Surface((clock_bg_width, clock_bg_height), pygame.SRCALPHA)
-        clock_bg.fill((25, 30, 40, 220))
+        fblits(surface, [(self._clock_bg, (clock_x - 6, clock_y - 3)),
+                         (clock_surface, (clock_x, clock_y))])
         
-        surface.blit(clock_bg, (clock_x - 6, clock_y - 3))
-        surface.blit(clock_surface, (clock_x, clock_y))
+        # The clock only changes once a second; report the old rect as well
+        # since a narrower time string uncovers part of it
+        clock_rect = pygame.Rect((clock_x - 6, clock_y - 3), self._clock_bg.get_size())
+        if clock_rect == self._clock_rect and current_second == self._clock_drawn_second:
+            return []
+        dirty_rects = [clock_rect] if self._clock_rect in (None, clock_rect) else [clock_rect, self._clock_rect]
+        self._clock_rect = clock_rect
+        self._clock_drawn_second = current_second
+        return dirty_rects
     
     def draw_dividers(self, surface, layout_areas):
         """Draw dividing lines between sections with fallback symbols"""
-        width, height = surface.get_size()
         border_color = COLORS['border']
-        
-        # Vertical divider
-        pygame.draw.line(surface, border_color, 
-                        (layout_areas['bubble_area'].right, 0), 
-                        (layout_areas['bubble_area'].right, height), 2)
-        
-        # Horizontal divider (table separation)
-        pygame.draw.line(surface, border_color, 
-                        (0, layout_areas['bubble_area'].bottom), 
-                        (layout_areas['bubble_area'].right, layout_areas['bubble_area'].bottom), 2)
-        
-        # News/Fear greed divider
-        pygame.draw.line(surface, border_color, 
-                        (layout_areas['news_area'].left, layout_areas['news_area'].bottom), 
-                        (layout_areas['news_area'].right, layout_areas['news_area'].bottom), 2)
+        for start, end in self._divider_segments:
+            pygame.draw.line(surface, border_color, start, end, 2)
 
 # Backward compatibility
 Dashboard = EnhancedDashboard
\ No newline at end of file
@@ -4,7 +4,11 @@ Visual effects for the cryptocurrency dashboard
 
 import pygame
 import random
+import math
+import numpy as np
+from functools import lru_cache
 from config.settings import COLORS
+from utils.render_cache import get_font, fblits
 
 class FloatingEffect:
     """Enhanced visual effect for price changes"""
@@ -15,7 +19,7 @@ class FloatingEffect:
         self.start_position = list(position)
         self.alpha = 255
         self.is_positive = is_positive
-        self.font = pygame.font.SysFont("Arial", 14, bold=True)
+        self.font = get_font("Arial", 14, bold=True)
         self.color = COLORS['positive'] if is_positive else COLORS['negative']
         self.lifetime = 120  # frames
         self.age = 0
@@ -24,6 +28,9 @@ class FloatingEffect:
         self.velocity_y = -1.5 if is_positive else 1.2
         self.velocity_x = random.uniform(-0.5, 0.5)
         self.scale = 1.0
+        
+        # Rendered text per font size; owned by this effect because draw sets its alpha
+        self._text_surfaces = {}
 
     def update(self):
         """Update the floating effect animation"""
@@ -54,10 +61,13 @@ class FloatingEffect:
         
         # Apply scaling
         scaled_font_size = max(10, int(14 * self.scale))
-        scaled_font = pygame.font.SysFont("Arial", scaled_font_size, bold=True)
         
-        # Create text surface
-        text_surface = scaled_font.render(self.text, True, self.color)
+        # Text surface, rendered once per size over the effect's lifetime
+        text_surface = self._text_surfaces.get(scaled_font_size)
+        if text_surface is None:
+            scaled_font = get_font("Arial", scaled_font_size, bold=True)
+            text_surface = scaled_font.render(self.text, True, self.color)
+            self._text_surfaces[scaled_font_size] = text_surface
         text_surface.set_alpha(int(self.alpha))
         rect = text_surface.get_rect(center=(int(self.position[0]), int(self.position[1])))
         surface.blit(text_surface, rect)
@@ -78,6 +88,9 @@ class PulseEffect:
         self.duration = duration
         self.age = 0
         self.alpha = 255
+        
+        # Full-brightness rings per integer radius; draw fades them with set_alpha
+        self._rings = {}
     
     def update(self):
         """Update pulse animation"""
@@ -95,70 +108,98 @@ class PulseEffect:
         if self.alpha <= 0:
             return
         
-        # Create transparent surface for the pulse
-        pulse_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        pulse_color = (*self.color, self.alpha)
-        pygame.draw.circle(pulse_surface, pulse_color, 
-                         (int(self.radius), int(self.radius)), int(self.radius), 3)
+        radius = int(self.radius)
+        ring = self._rings.get(radius)
+        if ring is None:
+            ring = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(ring, self.color, (radius, radius), radius, 3)
+            self._rings[radius] = ring
         
         # Blit to main surface
-        rect = pulse_surface.get_rect(center=self.center)
-        surface.blit(pulse_surface, rect)
+        ring.set_alpha(self.alpha)
+        surface.blit(ring, ring.get_rect(center=self.center))
     
     def is_alive(self):
         """Check if effect is still alive"""
         return self.age < self.duration
 
 
+@lru_cache(maxsize=1024)
+def _get_particle_sprite(color, alpha):
+    """Pre-rendered 6x6 particle circle for a color and alpha level"""
+    particle_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
+    pygame.draw.circle(particle_surface, (*color, alpha), (3, 3), 3)
+    return particle_surface
+
+
 class ParticleEffect:
     """Particle system for celebration effects"""
     
     def __init__(self, center, count=10, color=None):
-        self.particles = []
         self.center = center
         
-        for _ in range(count):
-            particle = {
-                'pos': [center[0], center[1]],
-                'vel': [random.uniform(-3, 3), random.uniform(-5, -1)],
-                'life': random.randint(30, 60),
-                'max_life': random.randint(30, 60),
-                'color': color or (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
-            }
-            self.particles.append(particle)
+        # Particles are stored as parallel arrays, one row per particle
+        self.pos = np.empty((count, 2), dtype=np.float64)
+        self.pos[:] = center
+        self.vel = np.column_stack((np.random.uniform(-3, 3, count),
+                                    np.random.uniform(-5, -1, count)))
+        self.life = np.random.randint(30, 61, count)
+        self.max_life = np.random.randint(30, 61, count)
+        if color:
+            self.color = np.tile(np.asarray(color[:3], dtype=np.int32), (count, 1))
+        else:
+            self.color = np.random.randint(100, 256, (count, 3))
     
     def update(self):
         """Update all particles"""
-        for particle in self.particles[:]:
-            # Update position
-            particle['pos'][0] += particle['vel'][0]
-            particle['pos'][1] += particle['vel'][1]
-            
-            # Apply gravity
-            particle['vel'][1] += 0.2
-            
-            # Reduce life
-            particle['life'] -= 1
-            
-            # Remove dead particles
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.pos += self.vel
+        
+        # Apply gravity
+        self.vel[:, 1] += 0.2
+        
+        self.life -= 1
+        
+        # Remove dead particles
+        alive = self.life > 0
+        if not alive.all():
+            self.pos = self.pos[alive]
+            self.vel = self.vel[alive]
+            self.life = self.life[alive]
+            self.max_life = self.max_life[alive]
+            self.color = self.color[alive]
     
     def draw(self, surface):
         """Draw all particles"""
-        for particle in self.particles:
-            life_ratio = particle['life'] / particle['max_life']
-            alpha = int(255 * life_ratio)
-            
-            if alpha > 0:
-                color = (*particle['color'], alpha)
-                particle_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surface, color, (3, 3), 3)
-                surface.blit(particle_surface, particle['pos'])
+        alphas = (255 * self.life / self.max_life).astype(np.int32)
+        visible = alphas > 0
+        
+        # Alpha is bucketed to 32 levels so sprites are shared across frames
+        alphas = np.minimum(alphas[visible] | 7, 255).tolist()
+        colors = [tuple(c) for c in self.color[visible].tolist()]
+        positions = self.pos[visible].tolist()
+        
+        fblits(surface, [(_get_particle_sprite(color, alpha), pos)
+                         for color, alpha, pos in zip(colors, alphas, positions)])
     
     def is_alive(self):
         """Check if any particles are still alive"""
-        return len(self.particles) > 0
+        return self.pos.shape[0] > 0
+
+
+@lru_cache(maxsize=64)
+def _build_glow(size, color, pulse_level):
+    """Composite the five glow layers for one integer pulse intensity"""
+    width, height = size
+    glow = pygame.Surface((width + 4, height + 4), pygame.SRCALPHA)
+    for i in range(5):
+        alpha = max(0, pulse_level - (i * 20))
+        if alpha > 0:
+            layer = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(layer, (*color, alpha), 
+                           (i, i, width - 2*i, height - 2*i), 
+                           border_radius=5)
+            glow.blit(layer, (i, i))
+    return glow
 
 
 class GlowEffect:
@@ -166,7 +207,7 @@ class GlowEffect:
     
     def __init__(self, rect, color, intensity=100):
         self.rect = rect
-        self.color = color
+        self.color = tuple(color)
         self.intensity = intensity
         self.pulse_phase = 0
     
@@ -176,20 +217,13 @@ class GlowEffect:
     
     def draw(self, surface):
         """Draw glow effect"""
-        # Create glow surface
         glow_rect = pygame.Rect(self.rect.x - 10, self.rect.y - 10, 
                                self.rect.width + 20, self.rect.height + 20)
         
-        # Pulsing intensity
-        pulse_intensity = self.intensity + (20 * abs(pygame.math.Vector2(1, 0).rotate(self.pulse_phase).x))
-        
-        # Draw multiple layers for glow effect
-        for i in range(5):
-            alpha = max(0, int(pulse_intensity - (i * 20)))
-            if alpha > 0:
-                glow_surface = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
-                glow_color = (*self.color, alpha)
-                pygame.draw.rect(glow_surface, glow_color, 
-                               (i, i, glow_rect.width - 2*i, glow_rect.height - 2*i), 
-                               border_radius=5)
-                surface.blit(glow_surface, (glow_rect.x + i, glow_rect.y + i))
\ No newline at end of file
+        # Pulsing intensity (pulse_phase is in degrees)
+        pulse_intensity = self.intensity + (20 * abs(math.cos(math.radians(self.pulse_phase))))
+        
+        # The layers only depend on the integer intensity, so the composite
+        # is built once per level and reused
+        glow = _build_glow(glow_rect.size, self.color, int(pulse_intensity))
+        surface.blit(glow, glow_rect.topleft)
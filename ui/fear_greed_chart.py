@@ -5,11 +5,15 @@ Enhanced with shorter tick marks, responsive labels, and consistent color direct
 
 import pygame
 import math
+import numpy as np
+import time
 import datetime
+from functools import lru_cache
 from config.settings import COLORS
+from utils.render_cache import get_font, render_text, fblits
 
-def get_fear_greed_label(value):
-    """Get label for Fear & Greed Index value"""
+def _fear_greed_label(value):
+    """Label for a Fear & Greed Index value"""
     if value <= 25:
         return "Extreme Fear"
     elif value <= 45:
@@ -21,8 +25,8 @@ def get_fear_greed_label(value):
     else:
         return "Extreme Greed"
 
-def get_perfected_fear_greed_color(value):
-    """Get perfected color progression with smooth transitions - CONSISTENT"""
+def _perfected_fear_greed_color(value):
+    """Perfected color progression with smooth transitions - CONSISTENT"""
     # Clamp value between 0 and 100
     value = max(0, min(100, value))
     
@@ -63,47 +67,198 @@ def get_perfected_fear_greed_color(value):
             int(100 - t * 20)       # 100 → 80 (less blue for purer green)
         )
 
+# Labels and colors for every integer index value, so the common case is a lookup
+_FEAR_GREED_LABELS = tuple(_fear_greed_label(v) for v in range(101))
+_FEAR_GREED_COLORS = tuple(_perfected_fear_greed_color(v) for v in range(101))
+
+def get_fear_greed_label(value):
+    """Get label for Fear & Greed Index value"""
+    if type(value) is int and 0 <= value <= 100:
+        return _FEAR_GREED_LABELS[value]
+    return _fear_greed_label(value)
+
+def get_perfected_fear_greed_color(value):
+    """Get perfected color progression with smooth transitions - CONSISTENT"""
+    if type(value) is int and 0 <= value <= 100:
+        return _FEAR_GREED_COLORS[value]
+    return _perfected_fear_greed_color(value)
+
+def get_perfected_fear_greed_colors(values):
+    """Vectorized get_perfected_fear_greed_color: an (N, 3) uint8 array for N values"""
+    values = np.clip(np.asarray(values, dtype=np.float64), 0, 100)
+    
+    # Same four ramps as _perfected_fear_greed_color, selected per value
+    t = np.select([values <= 25, values <= 50, values <= 75],
+                  [values / 25, (values - 25) / 25, (values - 50) / 25],
+                  (values - 75) / 25)
+    ramp = np.select([values <= 25, values <= 50, values <= 75], [0, 1, 2], 3)
+    starts = np.array([(200, 40, 40), (255, 110, 50), (255, 255, 70), (80, 255, 100)], dtype=np.float64)
+    deltas = np.array([(55, 70, 10), (0, 145, 20), (-175, 0, 30), (-20, -35, -20)], dtype=np.float64)
+    
+    return (starts[ramp] + t[:, None] * deltas[ramp]).astype(np.uint8)
+
 def create_enhanced_gauge_fill(center_x, center_y, radius, value):
-    """Create enhanced gauge fill with CONSISTENT color-value alignment"""
-    # Create surface for the gradient fill
+    """Create enhanced gauge fill with CONSISTENT color-value alignment
+    
+    The arc is rasterized in one pass with NumPy: every pixel of the 12px
+    ring gets the color of the gradient segment its angle falls in.
+    """
+    # Create surface for the gradient fill (the chart passes a whole-number float radius)
+    radius = int(radius)
     size = radius * 2 + 40
     fill_surface = pygame.Surface((size, size), pygame.SRCALPHA)
     
     # Calculate the total angle coverage for the current value
     total_angle_coverage = math.pi * (value / 100)  # 0 to π radians
+    if total_angle_coverage <= 0:
+        return fill_surface
     
     # FIXED: Fill from left (π) to right (0) as value increases
     # Left side (π) = 0 = Red (Fear), Right side (0) = 100 = Green (Greed)
     segments = 100  # High resolution for smooth gradient
+    angle_per_segment = total_angle_coverage / segments
+    segment_colors = get_perfected_fear_greed_colors(value * np.arange(segments) / segments)
+    
+    # Pixel offsets from the arc center over the upper half of the ring's
+    # bounding box, indexed [x, y] like surfarray
+    center = 20 + radius
+    left, top = center - radius, center - radius
+    dx = np.arange(left, center + radius + 1, dtype=np.float64)[:, None] - center
+    dy = center - np.arange(top, center + 1, dtype=np.float64)[None, :]
+    distance = np.hypot(dx, dy)
+    angle = np.arctan2(dy, dx)
+    
+    # Ring of the gauge, between π (left) and π - coverage
+    mask = ((distance <= radius) & (distance > radius - 12) &
+            (angle >= math.pi - total_angle_coverage))
+    segment_index = np.minimum(((math.pi - angle[mask]) / angle_per_segment).astype(np.intp),
+                               segments - 1)
+    
+    rgb = pygame.surfarray.pixels3d(fill_surface)[left:center + radius + 1, top:center + 1]
+    rgb[mask] = segment_colors[segment_index]
+    del rgb
+    alpha = pygame.surfarray.pixels_alpha(fill_surface)[left:center + radius + 1, top:center + 1]
+    alpha[mask] = 255
+    del alpha
     
-    if total_angle_coverage > 0:
-        angle_per_segment = total_angle_coverage / segments
-        
-        for i in range(segments):
-            # Calculate angles for this segment - filling from left to right
-            # Start from π (left) and progress toward 0 (right)
-            segment_start_angle = math.pi - (i * angle_per_segment)
-            segment_end_angle = math.pi - ((i + 1) * angle_per_segment)
+    return fill_surface
+
+@lru_cache(maxsize=16)
+def render_perfected_gauge_background(chart_radius):
+    """Render perfected gauge background (cached per radius; do not modify)"""
+    bg_surface = pygame.Surface((chart_radius * 2 + 40, chart_radius * 2 + 40), pygame.SRCALPHA)
+    
+    for layer in range(15):
+        layer_radius = chart_radius - layer
+        if layer_radius <= 0:
+            break
             
-            # Map segment position to color value (left=0, right=100)
-            segment_progress = i / segments  # 0 to 1
-            segment_value = value * segment_progress  # 0 up to current value
+        layer_alpha = max(12, 90 - layer * 5)
+        layer_color = (45, 55, 70, layer_alpha)
         
-            segment_color = get_perfected_fear_greed_color(segment_value)
-            
-            # Draw multiple layers for each segment for smooth appearance
-            for thickness in range(12, 0, -2):
-                alpha = int(255 * (13 - thickness) / 12 * 0.8)
-                layer_color = (*segment_color, alpha)
-                
-                try:
-                    arc_rect = pygame.Rect(20, 20, radius * 2, radius * 2)
-                    pygame.draw.arc(fill_surface, layer_color[:3], arc_rect,
-                                   segment_end_angle, segment_start_angle, thickness)
-                except:
-                    pass
+        try:
+            arc_rect = pygame.Rect(
+                20 + layer, 20 + layer,
+                2 * layer_radius, 2 * layer_radius
+            )
+            pygame.draw.arc(bg_surface, layer_color[:3], arc_rect,
+                           0, math.pi, max(1, 8 - layer // 2))
+        except:
+            pass
     
-    return fill_surface
+    return bg_surface
+
+@lru_cache(maxsize=16)
+def get_gauge_fill(radius, value):
+    """Get the value arc for a gauge radius and value (shared; do not modify)"""
+    return create_enhanced_gauge_fill(0, 0, radius, value)
+
+@lru_cache(maxsize=256)
+def get_change_indicator(change_value):
+    """Get (text, color) of the change indicator for a historical value"""
+    # Change indicator with enhanced colors
+    if change_value > 0:
+        return f" ↑+{change_value}", (70, 220, 110)
+    elif change_value < 0:
+        return f" ↓{change_value}", (230, 70, 70)
+    else:
+        return " →0", (160, 180, 200)
+
+def crop_to_content(overlay):
+    """Crop a mostly transparent overlay to its drawn area, returning (surface, offset)"""
+    bounds = overlay.get_bounding_rect()
+    return overlay.subsurface(bounds).copy(), bounds.topleft
+
+SCALE_POINTS = [
+    (0, "0", "Extreme Fear", (200, 40, 40)),
+    (25, "25", "Fear", (255, 110, 50)),
+    (50, "50", "Neutral", (255, 255, 70)),
+    (75, "75", "Greed", (80, 255, 100)),
+    (100, "100", "Extreme Greed", (60, 220, 80))
+]
+
+@lru_cache(maxsize=16)
+def get_scale_ticks(chart_radius):
+    """Get (surface, offset) of the scale tick marks relative to the gauge position (shared; do not modify)"""
+    size = chart_radius * 2 + 40
+    ticks_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    center = chart_radius + 20
+    
+    # REFINED: Tick marks with gap from center value
+    indicator_start_radius = chart_radius * 0.75
+    indicator_end_radius = chart_radius * 0.72
+    
+    for scale_value, scale_text, scale_desc, scale_color in SCALE_POINTS:
+        scale_angle = math.pi * (1 - scale_value / 100)
+        
+        start_x = center + int(indicator_start_radius * math.cos(scale_angle))
+        start_y = center - int(indicator_start_radius * math.sin(scale_angle))
+        end_x = center + int(indicator_end_radius * math.cos(scale_angle))
+        end_y = center - int(indicator_end_radius * math.sin(scale_angle))
+        
+        pygame.draw.line(ticks_surface, scale_color, (start_x, start_y), (end_x, end_y), 2)
+    
+    return crop_to_content(ticks_surface)
+
+@lru_cache(maxsize=16)
+def get_scale_labels(width, chart_center_x, chart_radius):
+    """Get (surface, offset) of the scale numbers and descriptions within a 45px strip (shared; do not modify)"""
+    labels_surface = pygame.Surface((width, 45), pygame.SRCALPHA)
+    
+    # The strip top sits 10px above the number row
+    scale_y = 10
+    
+    # RESPONSIVE: Calculate expanded spacing to use more available width
+    available_width = min(width * 0.8, chart_radius * 3)  # Use 80% of panel width or 3x radius
+    labels_left = chart_center_x - available_width // 2
+    
+    scale_font = get_font("Segoe UI", 11, bold=True)
+    desc_font = get_font("Segoe UI", 10, bold=True)
+    
+    # Evenly distribute labels across expanded width
+    for i, (scale_value, scale_text, scale_desc, scale_color) in enumerate(SCALE_POINTS):
+        x_pos = labels_left + (i / 4 * available_width)
+        
+        # Number with color
+        num_surface = render_text(scale_font, scale_text, scale_color)
+        labels_surface.blit(num_surface, num_surface.get_rect(center=(x_pos, scale_y)))
+        
+        # Description below number
+        desc_surface = render_text(desc_font, scale_desc, (170, 190, 210))
+        labels_surface.blit(desc_surface, desc_surface.get_rect(center=(x_pos, scale_y + 18)))
+    
+    return crop_to_content(labels_surface)
+
+@lru_cache(maxsize=64)
+def get_gauge(chart_radius, value):
+    """Get the complete gauge (background, value arc, scale ticks) as one surface (shared; do not modify)"""
+    gauge_surface = render_perfected_gauge_background(chart_radius).copy()
+    gauge_surface.blit(get_gauge_fill(chart_radius, value), (0, 0))
+    ticks_surface, ticks_offset = get_scale_ticks(chart_radius)
+    gauge_surface.blit(ticks_surface, ticks_offset)
+    if pygame.display.get_surface() is not None:
+        gauge_surface = gauge_surface.convert_alpha()
+    return gauge_surface
 
 def draw_fear_greed_chart(surface, fear_greed_data):
     """Draw refined Fear & Greed Index chart with enhanced design"""
@@ -118,36 +273,35 @@ def draw_fear_greed_chart(surface, fear_greed_data):
     last_month_data = fear_greed_data['last_month']
     last_updated = fear_greed_data.get('last_updated', None)
     
+    # Everything drawn on top of the background is collected here and
+    # blitted in one batch at the end, in the same order
+    blits = []
+    
     # Professional title section with timestamp in top-right
-    title_font = pygame.font.SysFont("Segoe UI", 18, bold=True)
-    title_surface = title_font.render("Fear & Greed Index", True, (220, 230, 250))
+    title_font = get_font("Segoe UI", 18, bold=True)
+    title_surface = render_text(title_font, "Fear & Greed Index", (220, 230, 250))
     
     # Center title
     title_x = (width - title_surface.get_width()) // 2
     title_y = 12
-    surface.blit(title_surface, (title_x, title_y))
+    blits.append((title_surface, (title_x, title_y)))
     
     # Last updated timestamp (top-right)
     if last_updated:
-        import time
-        update_time = time.time()
-        if hasattr(time, 'strftime'):
-            try:
-                formatted_time = time.strftime('%H:%M', time.localtime(last_updated))
-                timestamp_text = f"Last Updated: {formatted_time}"
-            except:
-                timestamp_text = "Last Updated: --:--"
-        else:
+        try:
+            formatted_time = time.strftime('%H:%M', time.localtime(last_updated))
+            timestamp_text = f"Last Updated: {formatted_time}"
+        except:
             timestamp_text = "Last Updated: --:--"
     else:
         timestamp_text = "Last Updated: --:--"
     
-    timestamp_font = pygame.font.SysFont("Segoe UI", 10)
-    timestamp_surface = timestamp_font.render(timestamp_text, True, (140, 160, 180))
+    timestamp_font = get_font("Segoe UI", 10)
+    timestamp_surface = render_text(timestamp_font, timestamp_text, (140, 160, 180))
     
     timestamp_x = width - timestamp_surface.get_width() - 10
     timestamp_y = 8
-    surface.blit(timestamp_surface, (timestamp_x, timestamp_y))
+    blits.append((timestamp_surface, (timestamp_x, timestamp_y)))
     
     # Chart positioning - BETTER CENTERED
     chart_center_x = int(width * 0.40)
@@ -155,68 +309,36 @@ def draw_fear_greed_chart(surface, fear_greed_data):
     chart_radius = min(width // 4.5, height // 3.5)
     chart_radius = max(chart_radius, 60)
     
-    # Enhanced gauge background
-    def render_perfected_gauge_background():
-        """Render perfected gauge background"""
-        bg_surface = pygame.Surface((chart_radius * 2 + 40, chart_radius * 2 + 40), pygame.SRCALPHA)
-        
-        for layer in range(15):
-            layer_radius = chart_radius - layer
-            if layer_radius <= 0:
-                break
-                
-            layer_alpha = max(12, 90 - layer * 5)
-            layer_color = (45, 55, 70, layer_alpha)
-            
-            try:
-                arc_rect = pygame.Rect(
-                    20 + layer, 20 + layer,
-                    2 * layer_radius, 2 * layer_radius
-                )
-                
-                arc_surface = pygame.Surface((2 * layer_radius + 4, 2 * layer_radius + 4), pygame.SRCALPHA)
-                pygame.draw.arc(arc_surface, layer_color[:3], 
-                               (2, 2, 2 * layer_radius, 2 * layer_radius),
-                               0, math.pi, max(1, 8 - layer // 2))
-                
-                bg_surface.blit(arc_surface, (20 + layer - 2, 20 + layer - 2))
-            except:
-                pass
-        
-        return bg_surface
-    
-    # Render enhanced gauge background
-    gauge_bg = render_perfected_gauge_background()
-    surface.blit(gauge_bg, (chart_center_x - chart_radius - 20, chart_center_y - chart_radius - 20))
-    
-    # Value arc with smooth gradient fill
-    value_fill = create_enhanced_gauge_fill(chart_center_x, chart_center_y, chart_radius, value)
-    surface.blit(value_fill, (chart_center_x - chart_radius - 20, chart_center_y - chart_radius - 20))
+    # Enhanced gauge (background, value arc and scale ticks) as one cached
+    # surface, only composited when the panel size or the index value changes
+    gauge_pos = (chart_center_x - chart_radius - 20, chart_center_y - chart_radius - 20)
+    blits.append((get_gauge(chart_radius, value), gauge_pos))
     
-    # Professional center value display
-    value_font = pygame.font.SysFont("Segoe UI", 28, bold=True)
-    value_surface = value_font.render(str(value), True, (255, 255, 255))
+    # Professional center value display (value and shadow share the text)
+    value_font = get_font("Segoe UI", 28, bold=True)
+    value_text = str(value)
+    value_surface = render_text(value_font, value_text, (255, 255, 255))
     value_rect = value_surface.get_rect(center=(chart_center_x, chart_center_y - 5))
     
     # Enhanced shadow for depth
-    shadow_surface = value_font.render(str(value), True, (25, 35, 50))
+    shadow_surface = render_text(value_font, value_text, (25, 35, 50))
     shadow_rect = shadow_surface.get_rect(center=(chart_center_x + 2, chart_center_y - 3))
-    surface.blit(shadow_surface, shadow_rect)
-    surface.blit(value_surface, value_rect)
+    blits.append((shadow_surface, shadow_rect))
+    blits.append((value_surface, value_rect))
     
     # Professional label with perfected color
-    label_font = pygame.font.SysFont("Segoe UI", 14, bold=True)
+    label_font = get_font("Segoe UI", 14, bold=True)
     label_color = get_perfected_fear_greed_color(value)
-    label_surface = label_font.render(label, True, label_color)
+    label_surface = render_text(label_font, label, label_color)
     label_rect = label_surface.get_rect(center=(chart_center_x, chart_center_y + 25))
-    surface.blit(label_surface, label_rect)
+    blits.append((label_surface, label_rect))
     
     # Enhanced historical data panel
     hist_x = chart_center_x + chart_radius + 35
     hist_start_y = chart_center_y - 50
     
-    hist_font = pygame.font.SysFont("Segoe UI", 12, bold=True)
-    small_font = pygame.font.SysFont("Segoe UI", 11)
+    hist_font = get_font("Segoe UI", 12, bold=True)
+    small_font = get_font("Segoe UI", 11)
     line_height = 26
     
     def draw_perfected_historical_line(y_pos, period_label, period_value, period_label_text, change_value):
@@ -224,38 +346,24 @@ def draw_fear_greed_chart(surface, fear_greed_data):
         if period_value is None:
             return y_pos
             
-        # Change indicator with enhanced colors
-        if change_value > 0:
-            change_color = (70, 220, 110)
-            change_symbol = "↑"
-            change_text = f"+{change_value}"
-        elif change_value < 0:
-            change_color = (230, 70, 70)
-            change_symbol = "↓"
-            change_text = f"{change_value}"
-        else:
-            change_color = (160, 180, 200)
-            change_symbol = "→"
-            change_text = "0"
-        
         # Period label
-        period_surface = small_font.render(f"{period_label}:", True, (150, 170, 190))
-        surface.blit(period_surface, (hist_x, y_pos))
+        period_surface = render_text(small_font, f"{period_label}:", (150, 170, 190))
+        blits.append((period_surface, (hist_x, y_pos)))
         
         # Value with perfected color
         value_color = get_perfected_fear_greed_color(period_value)
         value_text = f"{period_value}"
-        value_surface = hist_font.render(value_text, True, value_color)
+        value_surface = render_text(hist_font, value_text, value_color)
         value_x = hist_x + period_surface.get_width() + 8
-        surface.blit(value_surface, (value_x, y_pos - 1))
+        blits.append((value_surface, (value_x, y_pos - 1)))
         
         # Change indicator
-        change_full_text = f" {change_symbol}{change_text}"
-        change_surface = small_font.render(change_full_text, True, change_color)
+        change_full_text, change_color = get_change_indicator(change_value)
+        change_surface = render_text(small_font, change_full_text, change_color)
         change_x = value_x + value_surface.get_width() + 5
         
         if change_x + change_surface.get_width() <= width - 10:
-            surface.blit(change_surface, (change_x, y_pos))
+            blits.append((change_surface, (change_x, y_pos)))
         
         return y_pos + line_height
     
@@ -277,60 +385,11 @@ def draw_fear_greed_chart(surface, fear_greed_data):
         current_y = draw_perfected_historical_line(current_y, "Last Month", last_month_data['value'], 
                                                  last_month_label, last_month_data.get('change', 0))
     
-    # REFINED: Shorter tick indicators positioned closer to center
-    scale_points = [
-        (0, "0", "Extreme Fear", (200, 40, 40)),
-        (25, "25", "Fear", (255, 110, 50)),
-        (50, "50", "Neutral", (255, 255, 70)),
-        (75, "75", "Greed", (80, 255, 100)),
-        (100, "100", "Extreme Greed", (60, 220, 80))
-    ]
-    
-    # Draw SHORTER tick indicators positioned closer to center (50% shorter)
-    for scale_value, scale_text, scale_desc, scale_color in scale_points:
-        scale_angle = math.pi * (1 - scale_value / 100)
-        
-        # REFINED: Tick marks with gap from center value
-        indicator_start_radius = chart_radius * 0.75  # Moved outward for gap (was 0.75)
-        indicator_end_radius = chart_radius * 0.72    # Slightly adjusted end position
-        
-        start_x = chart_center_x + int(indicator_start_radius * math.cos(scale_angle))
-        start_y = chart_center_y - int(indicator_start_radius * math.sin(scale_angle))
-        end_x = chart_center_x + int(indicator_end_radius * math.cos(scale_angle))
-        end_y = chart_center_y - int(indicator_end_radius * math.sin(scale_angle))
-        
-        # Draw shorter tick line
-        pygame.draw.line(surface, scale_color, (start_x, start_y), (end_x, end_y), 2)
-    
+    # Scale labels only change with the panel size, so they are cached
     # RESPONSIVE: Bottom labels positioned to fill available width evenly
     scale_y = chart_center_y + chart_radius + 30
-    scale_descriptions = ["Extreme Fear", "Fear", "Neutral", "Greed", "Extreme Greed"]
-    scale_numbers = ["0", "25", "50", "75", "100"]
-    scale_colors = [(200, 40, 40), (255, 110, 50), (255, 255, 70), (80, 255, 100), (60, 220, 80)]
-    
-    # RESPONSIVE: Calculate expanded spacing to use more available width
-    available_width = min(width * 0.8, chart_radius * 3)  # Use 80% of panel width or 3x radius
-    labels_left = chart_center_x - available_width // 2
-    
-    # Font sizes for labels
-    scale_font = pygame.font.SysFont("Segoe UI", 11, bold=True)
-    desc_font = pygame.font.SysFont("Segoe UI", 10, bold=True)
-    
-    # Evenly distribute labels across expanded width
-    for i in range(5):
-        # Calculate position as percentage across expanded width (0%, 25%, 50%, 75%, 100%)
-        position_ratio = i / 4
-        x_pos = labels_left + (position_ratio * available_width)
-        
-        # Number with color
-        num_surface = scale_font.render(scale_numbers[i], True, scale_colors[i])
-        num_rect = num_surface.get_rect(center=(x_pos, scale_y))
-        surface.blit(num_surface, num_rect)
-        
-        # Description below number
-        desc_surface = desc_font.render(scale_descriptions[i], True, (170, 190, 210))
-        desc_rect = desc_surface.get_rect(center=(x_pos, scale_y + 18))
-        surface.blit(desc_surface, desc_rect)
+    labels_surface, (labels_dx, labels_dy) = get_scale_labels(width, chart_center_x, chart_radius)
+    blits.append((labels_surface, (labels_dx, scale_y - 10 + labels_dy)))
     
     # Professional timestamp
     legend_start_y = scale_y + 45
@@ -339,21 +398,23 @@ def draw_fear_greed_chart(surface, fear_greed_data):
         try:
             current_time = datetime.datetime.fromtimestamp(int(timestamp))
             time_text = f"Updated: {current_time.strftime('%b %d, %H:%M UTC')}"
-            time_font = pygame.font.SysFont("Segoe UI", 9)
-            time_surface = time_font.render(time_text, True, (120, 140, 160))
+            time_font = get_font("Segoe UI", 9)
+            time_surface = render_text(time_font, time_text, (120, 140, 160))
             
             time_x = (width - time_surface.get_width()) // 2
             time_y = legend_start_y
             if time_y + 15 < height - 5:
-                surface.blit(time_surface, (time_x, time_y))
+                blits.append((time_surface, (time_x, time_y)))
                 legend_start_y += 20
         except:
             pass
     
     # Compact legend
     if legend_start_y + 15 < height - 5:
-        legend_font = pygame.font.SysFont("Segoe UI", 9)
+        legend_font = get_font("Segoe UI", 9)
         legend_text = "Market sentiment: Red (Fear) → Yellow (Neutral) → Green (Greed)"
-        legend_surface = legend_font.render(legend_text, True, (130, 150, 170))
+        legend_surface = render_text(legend_font, legend_text, (130, 150, 170))
         legend_rect = legend_surface.get_rect(center=(width // 2, legend_start_y))
-        surface.blit(legend_surface, legend_rect)
\ No newline at end of file
+        blits.append((legend_surface, legend_rect))
+    
+    fblits(surface, blits)
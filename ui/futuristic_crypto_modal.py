@@ -17,6 +17,7 @@ from typing import List, Tuple, Optional, Dict, Any
 from config.settings import COLORS, FONT_SIZES, SYMBOL_TO_ID
 from utils.formatters import format_large_number, format_supply, format_price
 from data.chart_data import HistoricalDataGenerator
+from utils.render_cache import get_font, render_text, fblits
 
 class ParticleSystem:
     """Sistema de partículas para efeitos visuais"""
@@ -421,6 +422,10 @@ class HolographicButton:
         self.hover = False
         self.glow_intensity = 0.0
         
+        # Sprite pronto para o estado atual, refeito só quando active muda
+        self._surface = None
+        self._surface_active = None
+        
     def update(self, dt: float, mouse_pos: tuple):
         """Atualiza estado do botão"""
         self.hover = self.rect.collidepoint(mouse_pos)
@@ -431,8 +436,21 @@ class HolographicButton:
         else:
             self.glow_intensity = max(0.0, self.glow_intensity - dt * 4)
     
-    def render(self, surface: pygame.Surface):
-        """Renderiza botão holográfico"""
+    @property
+    def pos(self) -> Tuple[int, int]:
+        """Posição do sprite no modal"""
+        return self.rect.topleft
+    
+    @property
+    def current_surface(self) -> pygame.Surface:
+        """Sprite do botão, reconstruído só quando o estado muda"""
+        if self._surface is None or self._surface_active != self.active:
+            self._surface = self._build_surface()
+            self._surface_active = self.active
+        return self._surface
+    
+    def _build_surface(self) -> pygame.Surface:
+        """Desenha fundo, borda e texto do botão num sprite"""
         # Cores baseadas no estado
         if self.active:
             base_color = (0, 255, 255)
@@ -452,21 +470,26 @@ class HolographicButton:
                         (0, 0, self.rect.width, self.rect.height), 
                         2, border_radius=6)
         
-        surface.blit(btn_surface, self.rect.topleft)
-        
         # Texto
-        font = pygame.font.SysFont("Consolas", 12, bold=True)
+        font = get_font("Consolas", 12, bold=True)
         text_color = (255, 255, 255) if self.active else (200, 200, 200)
-        text_surface = font.render(self.text, True, text_color)
+        text_surface = render_text(font, self.text, text_color)
         
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=(self.rect.width // 2, self.rect.height // 2))
+        btn_surface.blit(text_surface, text_rect)
+        return btn_surface
+    
+    def render(self, surface: pygame.Surface):
+        """Renderiza botão holográfico"""
+        surface.blit(self.current_surface, self.pos)
 
 class FuturisticCryptoModal:
     """Modal futurístico para detalhes da criptomoeda"""
     
+    # Rótulos fixos do painel de estatísticas
+    STATS_LABELS = ("MARKET CAP", "VOLUME 24H", "RANK", "SUPPLY")
+    
     def __init__(self, coin_data: dict, screen_size: tuple):
-        self.coin_data = coin_data
         self.screen_size = screen_size
         self.symbol = coin_data['symbol'].upper()
         self.is_active = False
@@ -477,6 +500,15 @@ class FuturisticCryptoModal:
         self.x = (screen_size[0] - self.width) // 2
         self.y = (screen_size[1] - self.height) // 2
         
+        # Painel de estatísticas: fundo e rótulos prontos, valores por dados
+        self._stats_panel_rect = pygame.Rect(self.width - 300, 80, 280, self.height - 160)
+        self._stats_panel_surface = self._create_stats_panel_surface()
+        font_label = get_font("Consolas", 11)
+        self._label_surfaces = [font_label.render(label, True, (100, 200, 255))
+                                for label in self.STATS_LABELS]
+        self._value_surfaces = []
+        self.set_coin_data(coin_data)
+        
         # Sistema de gráficos
         chart_width = self.width - 350
         chart_height = self.height - 200
@@ -507,13 +539,46 @@ class FuturisticCryptoModal:
         
         # Estado de mouse
         self.mouse_pos = (0, 0)
-        self.close_button_rect = None
+        
+        # Botão de fechar: posição fixa e sprites normal / hover
+        button_size = 40
+        self.close_button_rect = pygame.Rect(self.width - button_size - 20, 20, button_size, button_size)
+        self._close_idle = self._create_close_sprite((255, 100, 100))
+        self._close_hover = self._create_close_sprite((255, 150, 150))
         
         print(f"🚀 Futuristic modal created for {self.symbol}")
         
         # Gera gráfico inicial
         self.generate_chart()
     
+    def set_coin_data(self, coin_data: dict):
+        """Atualiza os dados da moeda e pré-renderiza os valores das estatísticas"""
+        self.coin_data = coin_data
+        
+        rank = coin_data.get('market_cap_rank', 'N/A')
+        values = [
+            (format_large_number(coin_data.get('market_cap', 0)), (100, 255, 150)),
+            (format_large_number(coin_data.get('total_volume', 0)), (100, 255, 150)),
+            (f"#{rank}" if rank != 'N/A' else 'N/A', (255, 200, 100)),
+            (format_supply(coin_data.get('circulating_supply', 0)), (255, 255, 255))
+        ]
+        
+        font_value = get_font("Consolas", 13, bold=True)
+        self._value_surfaces = [font_value.render(str(value), True, color)
+                                for value, color in values]
+    
+    def _create_stats_panel_surface(self) -> pygame.Surface:
+        """Desenha o fundo do painel de estatísticas uma única vez"""
+        panel_width, panel_height = self._stats_panel_rect.size
+        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        pygame.draw.rect(panel_surface, (5, 10, 20, 230), 
+                        (0, 0, panel_width, panel_height), 
+                        border_radius=10)
+        pygame.draw.rect(panel_surface, (0, 255, 255, 150), 
+                        (0, 0, panel_width, panel_height), 
+                        2, border_radius=10)
+        return panel_surface
+    
     def create_buttons(self):
         """Cria botões para timeframes"""
         button_width = 60
@@ -755,8 +820,7 @@ class FuturisticCryptoModal:
     
     def render_timeframe_buttons(self, surface: pygame.Surface):
         """Renderiza botões de timeframe"""
-        for button in self.buttons.values():
-            button.render(surface)
+        fblits(surface, [(button.current_surface, button.pos) for button in self.buttons.values()])
     
     def render_chart_area(self, surface: pygame.Surface):
         """Renderiza área do gráfico"""
@@ -775,87 +839,48 @@ class FuturisticCryptoModal:
     
     def render_stats_panel(self, surface: pygame.Surface):
         """Renderiza painel de estatísticas"""
-        panel_x = self.width - 300
-        panel_y = 80
-        panel_width = 280
-        panel_height = self.height - 160
-        
-        # Background do painel
-        panel_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        pygame.draw.rect(panel_surface, (5, 10, 20, 230), 
-                        (0, 0, panel_width, panel_height), 
-                        border_radius=10)
-        pygame.draw.rect(panel_surface, (0, 255, 255, 150), 
-                        (0, 0, panel_width, panel_height), 
-                        2, border_radius=10)
-        
-        surface.blit(panel_surface, (panel_x, panel_y))
-        
-        # Dados das estatísticas
-        font_label = pygame.font.SysFont("Consolas", 11)
-        font_value = pygame.font.SysFont("Consolas", 13, bold=True)
-        
-        stats = [
-            ("MARKET CAP", format_large_number(self.coin_data.get('market_cap', 0))),
-            ("VOLUME 24H", format_large_number(self.coin_data.get('total_volume', 0))),
-            ("RANK", f"#{self.coin_data.get('market_cap_rank', 'N/A')}" 
-                    if self.coin_data.get('market_cap_rank') != 'N/A' else 'N/A'),
-            ("SUPPLY", format_supply(self.coin_data.get('circulating_supply', 0)))
-        ]
+        panel_x, panel_y = self._stats_panel_rect.topleft
+        panel_height = self._stats_panel_rect.height
         
         y_offset = panel_y + 20
-        line_height = (panel_height - 40) // len(stats)
+        line_height = (panel_height - 40) // len(self._label_surfaces)
         
-        for i, (label, value) in enumerate(stats):
+        blit_seq = [(self._stats_panel_surface, (panel_x, panel_y))]
+        for i, (label_surface, value_surface) in enumerate(zip(self._label_surfaces, self._value_surfaces)):
             current_y = y_offset + i * line_height
-            
-            # Label
-            label_surface = font_label.render(label, True, (100, 200, 255))
-            surface.blit(label_surface, (panel_x + 15, current_y))
-            
-            # Value
-            if "MARKET CAP" in label or "VOLUME" in label:
-                value_color = (100, 255, 150)
-            elif "RANK" in label:
-                value_color = (255, 200, 100)
-            else:
-                value_color = (255, 255, 255)
-            
-            value_surface = font_value.render(str(value), True, value_color)
-            surface.blit(value_surface, (panel_x + 15, current_y + 15))
-    
-    def render_close_button(self, surface: pygame.Surface):
-        """Renderiza botão de fechar"""
-        button_size = 40
-        button_x = self.width - button_size - 20
-        button_y = 20
-        
-        self.close_button_rect = pygame.Rect(button_x, button_y, button_size, button_size)
+            blit_seq.append((label_surface, (panel_x + 15, current_y)))
+            blit_seq.append((value_surface, (panel_x + 15, current_y + 15)))
         
-        # Hover
-        mouse_in_button = self.close_button_rect.collidepoint(
-            self.mouse_pos[0] - self.x, self.mouse_pos[1] - self.y
-        )
+        fblits(surface, blit_seq)
+    
+    def _create_close_sprite(self, border_color) -> pygame.Surface:
+        """Pré-renderiza o botão de fechar para um estado de hover"""
+        button_size = self.close_button_rect.width
+        sprite = pygame.Surface((button_size, button_size), pygame.SRCALPHA)
+        center = (button_size // 2, button_size // 2)
         
         # Background
-        pygame.draw.circle(surface, (40, 20, 20), 
-                         (button_x + button_size//2, button_y + button_size//2), 
-                         button_size//2)
+        pygame.draw.circle(sprite, (40, 20, 20), center, button_size//2)
         
         # Border
-        border_color = (255, 150, 150) if mouse_in_button else (255, 100, 100)
-        pygame.draw.circle(surface, border_color, 
-                         (button_x + button_size//2, button_y + button_size//2), 
-                         button_size//2, 2)
+        pygame.draw.circle(sprite, border_color, center, button_size//2, 2)
         
         # X symbol
-        center_x = button_x + button_size//2
-        center_y = button_y + button_size//2
+        center_x, center_y = center
         line_len = button_size//4
         
-        pygame.draw.line(surface, (255, 255, 255), 
+        pygame.draw.line(sprite, (255, 255, 255), 
                         (center_x - line_len, center_y - line_len),
                         (center_x + line_len, center_y + line_len), 3)
-        pygame.draw.line(surface, (255, 255, 255), 
+        pygame.draw.line(sprite, (255, 255, 255), 
                         (center_x + line_len, center_y - line_len),
-                        (center_x - line_len, center_y + line_len), 3)
\ No newline at end of file
+                        (center_x - line_len, center_y + line_len), 3)
+        return sprite
+    
+    def render_close_button(self, surface: pygame.Surface):
+        """Renderiza botão de fechar"""
+        mouse_in_button = self.close_button_rect.collidepoint(
+            self.mouse_pos[0] - self.x, self.mouse_pos[1] - self.y
+        )
+        surface.blit(self._close_hover if mouse_in_button else self._close_idle,
+                     self.close_button_rect)
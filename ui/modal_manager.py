@@ -163,9 +163,33 @@ class BasicFallbackModal:
         self.x = (screen_size[0] - self.width) // 2
         self.y = (screen_size[1] - self.height) // 2
         
-        self.close_button_rect = None
+        # Close button position and its idle / hover faces
+        button_size = 30
+        self.close_button_rect = pygame.Rect(self.x + self.width - button_size - 10, self.y + 10,
+                                             button_size, button_size)
+        self._close_idle = self._create_close_sprite((120, 60, 60))
+        self._close_hover = self._create_close_sprite((200, 80, 80))
         self.mouse_pos = (0, 0)
         
+    def _create_close_sprite(self, button_color) -> pygame.Surface:
+        """Pre-render the close button face for one hover state"""
+        button_size = self.close_button_rect.width
+        sprite = pygame.Surface((button_size, button_size), pygame.SRCALPHA)
+        pygame.draw.rect(sprite, button_color, sprite.get_rect(), border_radius=4)
+        
+        # X symbol
+        center_x = button_size // 2
+        center_y = button_size // 2
+        line_len = button_size // 4
+        
+        pygame.draw.line(sprite, (255, 255, 255), 
+                        (center_x - line_len, center_y - line_len),
+                        (center_x + line_len, center_y + line_len), 2)
+        pygame.draw.line(sprite, (255, 255, 255), 
+                        (center_x + line_len, center_y - line_len),
+                        (center_x - line_len, center_y + line_len), 2)
+        return sprite
+        
     def open(self):
         """Open basic modal"""
         self.is_active = True
@@ -255,26 +279,6 @@ class BasicFallbackModal:
         surface.blit(message_surface, (self.x + 30, self.y + 180))
         
         # Close button
-        button_size = 30
-        button_x = self.x + self.width - button_size - 10
-        button_y = self.y + 10
-        
-        self.close_button_rect = pygame.Rect(button_x, button_y, button_size, button_size)
-        
-        # Check hover
         mouse_in_button = self.close_button_rect.collidepoint(self.mouse_pos)
-        button_color = (200, 80, 80) if mouse_in_button else (120, 60, 60)
-        
-        pygame.draw.rect(surface, button_color, self.close_button_rect, border_radius=4)
-        
-        # X symbol
-        center_x = button_x + button_size // 2
-        center_y = button_y + button_size // 2
-        line_len = button_size // 4
-        
-        pygame.draw.line(surface, (255, 255, 255), 
-                        (center_x - line_len, center_y - line_len),
-                        (center_x + line_len, center_y + line_len), 2)
-        pygame.draw.line(surface, (255, 255, 255), 
-                        (center_x + line_len, center_y - line_len),
-                        (center_x - line_len, center_y + line_len), 2)
\ No newline at end of file
+        surface.blit(self._close_hover if mouse_in_button else self._close_idle,
+                     self.close_button_rect)
\ No newline at end of file
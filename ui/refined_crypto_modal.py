@@ -4,21 +4,28 @@ Minimal, clean interface focused on usability and clarity
 """
 
 import pygame
-import os
 import time
 import random
 import datetime
-import math
-from threading import Thread
+import numpy as np
+from collections import OrderedDict
+from threading import Thread, Lock
 from typing import List, Tuple, Optional, Dict, Any
 
 from config.settings import COLORS, FONT_SIZES, SYMBOL_TO_ID
 from utils.formatters import format_large_number, format_supply, format_price
-from data.chart_data import HistoricalDataGenerator
+from utils.render_cache import get_font, render_text, fblits
+from utils.logo_loader import get_logo_surface
+from data.chart_data import HistoricalDataGenerator, ChartSeries
+from data.chart_math import compute_chart_points
 
 class ProfessionalTooltip:
     """Professional investment-grade tooltip system"""
     
+    PADDING = 16
+    LINE_SPACING = 22
+    HEADER_HEIGHT = 20
+    
     def __init__(self):
         self.visible = False
         self.position = (0, 0)
@@ -27,38 +34,57 @@ class ProfessionalTooltip:
         self.target_progress = 0
         self.last_update = time.time()
         
+        # Fonts are created once, not per frame
+        self.header_font = get_font("Segoe UI", 12, bold=True)
+        self.value_font = get_font("Segoe UI", 14, bold=True)
+        self.label_font = get_font("Segoe UI", 10)
+        
+        # Rendered text surfaces. These are private to the tooltip because
+        # render() sets their alpha right before each blit.
+        self._label_cache = {
+            label: self.label_font.render(label, True, (160, 180, 200))
+            for label in ("PRICE", "TIME", "VOLUME", "CHANGE")
+        }
+        self._header_surface = self.header_font.render("DATA POINT", True, (200, 220, 255))
+        self._value_cache = OrderedDict()
+        self._value_cache_size = 128
+        
+        # Row layout, rebuilt by show() only when the data changes
+        self._lines = []
+        self._size = (0, 0)
+        
+    def _get_label_surface(self, label: str) -> pygame.Surface:
+        """Get the rendered surface for a constant row label"""
+        label_surface = self._label_cache.get(label)
+        if label_surface is None:
+            label_surface = self.label_font.render(label, True, (160, 180, 200))
+            self._label_cache[label] = label_surface
+        return label_surface
+        
+    def _get_value_surface(self, value: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get the rendered surface for a row value, keeping the most recent ones"""
+        key = (value, color)
+        value_surface = self._value_cache.get(key)
+        if value_surface is None:
+            value_surface = self.value_font.render(value, True, color)
+            self._value_cache[key] = value_surface
+            if len(self._value_cache) > self._value_cache_size:
+                self._value_cache.popitem(last=False)
+        else:
+            self._value_cache.move_to_end(key)
+        return value_surface
+        
     def show(self, pos: Tuple[int, int], data: Dict[str, Any]):
         """Show tooltip with investment-grade data"""
         self.position = pos
-        self.data = data
         self.visible = True
         self.target_progress = 1.0
+        if data != self.data:
+            self.data = data
+            self._layout_lines()
         
-    def hide(self):
-        """Hide tooltip smoothly"""
-        self.target_progress = 0.0
-        
-    def update(self, dt: float):
-        """Update tooltip animation"""
-        # Smooth animation
-        if self.target_progress > self.animation_progress:
-            self.animation_progress = min(1.0, self.animation_progress + dt * 12)
-        else:
-            self.animation_progress = max(0.0, self.animation_progress - dt * 12)
-            
-        if self.animation_progress <= 0:
-            self.visible = False
-            
-    def render(self, surface: pygame.Surface):
-        """Render professional tooltip"""
-        if not self.visible or self.animation_progress <= 0:
-            return
-            
-        # Professional font
-        header_font = pygame.font.SysFont("Segoe UI", 12, bold=True)
-        value_font = pygame.font.SysFont("Segoe UI", 14, bold=True)
-        label_font = pygame.font.SysFont("Segoe UI", 10)
-        
+    def _layout_lines(self):
+        """Format the data rows and measure the tooltip once per data change"""
         # Prepare data lines
         lines = []
         if 'price' in self.data:
@@ -77,24 +103,47 @@ class ProfessionalTooltip:
             change_color = (100, 255, 180) if change >= 0 else (255, 120, 120)
             change_str = f"{change:+.2f}%"
             lines.append(("CHANGE", change_str, change_color))
-        
-        if not lines:
-            return
             
         # Calculate dimensions
-        padding = 16
-        line_spacing = 22
-        header_height = 20
-        
         max_width = 0
         for label, value, color in lines:
-            label_width = label_font.size(label)[0]
-            value_width = value_font.size(value)[0]
-            total_width = max(label_width, value_width) + padding * 2
+            label_width = self.label_font.size(label)[0]
+            value_width = self.value_font.size(value)[0]
+            total_width = max(label_width, value_width) + self.PADDING * 2
             max_width = max(max_width, total_width)
             
-        tooltip_width = max(max_width, 180)
-        tooltip_height = header_height + len(lines) * line_spacing + padding
+        self._lines = lines
+        self._size = (max(max_width, 180),
+                      self.HEADER_HEIGHT + len(lines) * self.LINE_SPACING + self.PADDING)
+        
+    def hide(self):
+        """Hide tooltip smoothly"""
+        self.target_progress = 0.0
+        
+    def update(self, dt: float):
+        """Update tooltip animation"""
+        # Smooth animation
+        if self.target_progress > self.animation_progress:
+            self.animation_progress = min(1.0, self.animation_progress + dt * 12)
+        else:
+            self.animation_progress = max(0.0, self.animation_progress - dt * 12)
+            
+        if self.animation_progress <= 0:
+            self.visible = False
+            
+    def render(self, surface: pygame.Surface):
+        """Render professional tooltip"""
+        if not self.visible or self.animation_progress <= 0:
+            return
+            
+        lines = self._lines
+        if not lines:
+            return
+            
+        padding = self.PADDING
+        line_spacing = self.LINE_SPACING
+        header_height = self.HEADER_HEIGHT
+        tooltip_width, tooltip_height = self._size
         
         # Adjust position to stay on screen
         x, y = self.position
@@ -131,8 +180,7 @@ class ProfessionalTooltip:
             text_alpha = int(255 * min(1.0, (scale - 0.3) / 0.7))
             
             # Header
-            header_text = "DATA POINT"
-            header_surface = header_font.render(header_text, True, (200, 220, 255))
+            header_surface = self._header_surface
             header_surface.set_alpha(text_alpha)
             
             header_x = (final_width - header_surface.get_width()) // 2
@@ -142,12 +190,12 @@ class ProfessionalTooltip:
             current_y = header_height
             for label, value, color in lines:
                 # Label
-                label_surface = label_font.render(label, True, (160, 180, 200))
+                label_surface = self._get_label_surface(label)
                 label_surface.set_alpha(text_alpha)
                 tooltip_surface.blit(label_surface, (padding, current_y))
                 
                 # Value
-                value_surface = value_font.render(value, True, color)
+                value_surface = self._get_value_surface(value, color)
                 value_surface.set_alpha(text_alpha)
                 tooltip_surface.blit(value_surface, (padding, current_y + 8))
                 
@@ -158,6 +206,8 @@ class ProfessionalTooltip:
 class ProfessionalChartRenderer:
     """Investment-grade chart renderer with smooth interactions"""
     
+    HOVER_RADIUS = 25
+    
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
@@ -170,6 +220,7 @@ class ProfessionalChartRenderer:
         self.tooltip = ProfessionalTooltip()
         self.mouse_pos = (0, 0)
         self.hovered_point_index = None
+        self._chart_points_np = np.empty((0, 2), dtype=np.int32)
         
         # Professional colors
         self.primary_color = (70, 120, 180)
@@ -178,6 +229,58 @@ class ProfessionalChartRenderer:
         self.grid_color = (40, 50, 65)
         self.text_color = (180, 190, 210)
         
+        # Fixed chart geometry, resolved once instead of per render
+        crect = self.chart_rect
+        self._hover_rect = crect.inflate(self.HOVER_RADIUS * 2, self.HOVER_RADIUS * 2)
+        self._y_tick_positions = [crect.bottom - (i / 5) * crect.height for i in range(6)]
+        self._x_tick_positions = [crect.left + (i / 4) * crect.width for i in range(5)]
+        self._x_label_y = crect.bottom + 8
+        self._grid_rects = self._create_grid_rects()
+        
+        # Area fill: one opaque polygon multiplied by a vertical alpha ramp
+        self._fill_gradient = self._create_fill_gradient()
+        self._area_fill_surface = pygame.Surface(self.chart_rect.size, pygame.SRCALPHA)
+        
+        # Reused chart target; the no-data placeholder is built on first use
+        self._chart_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._no_data_surface = None
+        
+        # Translucent crosshair strokes, blitted instead of drawn per hover
+        self._crosshair_h = pygame.Surface((self.chart_rect.width, 1), pygame.SRCALPHA)
+        self._crosshair_h.fill((100, 150, 200, 150))
+        self._crosshair_v = pygame.Surface((1, self.chart_rect.height), pygame.SRCALPHA)
+        self._crosshair_v.fill((100, 150, 200, 150))
+        
+        # Hovered-point highlight sprites, one per trend color
+        self._highlight_sprites = {
+            color: self._create_highlight_sprite(color)
+            for color in (self.primary_color, self.positive_color, self.negative_color)
+        }
+        
+        # Subtle marker dot for the sampled points along the line
+        self._dot_sprite = pygame.Surface((5, 5), pygame.SRCALPHA)
+        pygame.draw.circle(self._dot_sprite, (255, 255, 255, 180), (2, 2), 2)
+        
+        # Reusable glow layer covering the chart plus room for the widest stroke
+        self._glow_rect = self.chart_rect.inflate(8, 8)
+        self._glow_surface = pygame.Surface(self._glow_rect.size, pygame.SRCALPHA)
+        
+    def _create_fill_gradient(self) -> pygame.Surface:
+        """Build a white chart-sized surface whose alpha fades from 60 to 0 downwards"""
+        column = pygame.Surface((1, self.chart_rect.height), pygame.SRCALPHA)
+        column.fill((255, 255, 255, 255))
+        alpha = pygame.surfarray.pixels_alpha(column)
+        alpha[0, :] = np.linspace(60, 0, self.chart_rect.height).astype(np.uint8)
+        del alpha  # Unlock the surface
+        return pygame.transform.scale(column, self.chart_rect.size)
+        
+    def _create_highlight_sprite(self, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Pre-render the hovered-point marker: white ring around a trend-colored dot"""
+        sprite = pygame.Surface((14, 14), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (255, 255, 255), (7, 7), 6)
+        pygame.draw.circle(sprite, color, (7, 7), 4)
+        return sprite
+        
     def update(self, dt: float, mouse_pos: Tuple[int, int]):
         """Update chart interactions"""
         self.mouse_pos = mouse_pos
@@ -198,29 +301,33 @@ class ProfessionalChartRenderer:
         if not data_points or len(data_points) < 2:
             return self.render_no_data_chart()
             
-        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        surface.fill((15, 20, 28))
+        surface = self._chart_surface
+        surface.fill((15, 20, 28, 255))
         
         # Process data
-        prices = [point['price'] for point in data_points]
-        timestamps = [point['timestamp'] for point in data_points]
-        
-        min_price = min(prices)
-        max_price = max(prices)
-        price_range = max_price - min_price if max_price != min_price else max_price * 0.1
+        if isinstance(data_points, ChartSeries):
+            prices = data_points.prices
+            timestamps = data_points.timestamps
+        else:
+            # List-of-dicts input: extract both columns in a single pass
+            price_list, timestamps = map(list, zip(*((p['price'], p['timestamp']) for p in data_points)))
+            prices = np.asarray(price_list, dtype=np.float64)
+        
+        # Calculate chart points and price bounds in one compiled pass
+        chart_points_arr, min_price, max_price = compute_chart_points(
+            prices, self.chart_rect.left, self.chart_rect.bottom,
+            self.chart_rect.width, self.chart_rect.height
+        )
+        min_price = float(min_price)
+        max_price = float(max_price)
+        chart_points = chart_points_arr.tolist()
+        self._chart_points_np = chart_points_arr
         
         # Calculate trend
-        first_price = prices[0]
-        last_price = prices[-1]
+        first_price = float(prices[0])
+        last_price = float(prices[-1])
         change_percent = ((last_price - first_price) / first_price) * 100 if first_price > 0 else 0
         line_color = self.get_trend_color(change_percent)
-        
-        # Calculate chart points
-        chart_points = []
-        for i, price in enumerate(prices):
-            x = self.chart_rect.left + (i / (len(prices) - 1)) * self.chart_rect.width
-            y = self.chart_rect.bottom - ((price - min_price) / price_range) * self.chart_rect.height
-            chart_points.append((int(x), int(y)))
             
         # Render professional grid
         self.render_professional_grid(surface)
@@ -242,19 +349,25 @@ class ProfessionalChartRenderer:
         
         return surface
         
-    def render_professional_grid(self, surface: pygame.Surface):
-        """Render clean professional grid"""
+    def _create_grid_rects(self) -> List[pygame.Rect]:
+        """Precompute the 1px grid strips; chart_rect never changes after construction"""
+        rects = []
+        
         # Vertical lines
         for i in range(1, 6):
-            x = self.chart_rect.left + (i / 6) * self.chart_rect.width
-            pygame.draw.line(surface, self.grid_color, 
-                           (x, self.chart_rect.top), (x, self.chart_rect.bottom), 1)
-                           
+            x = int(self.chart_rect.left + (i / 6) * self.chart_rect.width)
+            rects.append(pygame.Rect(x, self.chart_rect.top, 1, self.chart_rect.height + 1))
+            
         # Horizontal lines
         for i in range(1, 5):
-            y = self.chart_rect.top + (i / 5) * self.chart_rect.height
-            pygame.draw.line(surface, self.grid_color, 
-                           (self.chart_rect.left, y), (self.chart_rect.right, y), 1)
+            y = int(self.chart_rect.top + (i / 5) * self.chart_rect.height)
+            rects.append(pygame.Rect(self.chart_rect.left, y, self.chart_rect.width + 1, 1))
+        return rects
+        
+    def render_professional_grid(self, surface: pygame.Surface):
+        """Render clean professional grid"""
+        for rect in self._grid_rects:
+            surface.fill(self.grid_color, rect)
                            
     def render_chart_fill(self, surface: pygame.Surface, points: List[Tuple[int, int]], 
                          color: Tuple[int, int, int]):
@@ -262,29 +375,19 @@ class ProfessionalChartRenderer:
         if len(points) < 2:
             return
             
-        # Create fill polygon
-        fill_points = points.copy()
-        fill_points.append((points[-1][0], self.chart_rect.bottom))
-        fill_points.append((points[0][0], self.chart_rect.bottom))
+        # Create fill polygon in chart_rect-local coordinates
+        left, top = self.chart_rect.topleft
+        fill_points = [(x - left, y - top) for x, y in points]
+        fill_points.append((points[-1][0] - left, self.chart_rect.height))
+        fill_points.append((points[0][0] - left, self.chart_rect.height))
         
-        # Create gradient fill
-        fill_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        # Draw the polygon once, then fade it with the vertical alpha ramp
+        fill_surface = self._area_fill_surface
+        fill_surface.fill((0, 0, 0, 0))
+        pygame.draw.polygon(fill_surface, (*color, 255), fill_points)
+        fill_surface.blit(self._fill_gradient, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
         
-        # Multi-layer gradient for smoothness
-        for i in range(20):
-            alpha = int(60 * (1 - i / 20))
-            if alpha > 0:
-                gradient_color = (*color, alpha)
-                
-                # Create slightly smaller polygon for each layer
-                offset_points = []
-                for point in fill_points:
-                    offset_y = point[1] + i * 2
-                    offset_points.append((point[0], min(offset_y, self.chart_rect.bottom)))
-                
-                pygame.draw.polygon(fill_surface, gradient_color, offset_points)
-                
-        surface.blit(fill_surface, (0, 0))
+        surface.blit(fill_surface, (left, top))
         
     def render_chart_line(self, surface: pygame.Surface, points: List[Tuple[int, int]], 
                          color: Tuple[int, int, int]):
@@ -292,35 +395,55 @@ class ProfessionalChartRenderer:
         if len(points) < 2:
             return
             
-        # Main line with slight glow
-        for thickness in [5, 3, 1]:
-            alpha = 255 if thickness == 1 else 60
-            line_color = (*color, alpha) if thickness > 1 else color
-            
-            # Create line surface for alpha blending
-            if thickness > 1:
-                line_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-                pygame.draw.lines(line_surface, line_color, False, points, thickness)
-                surface.blit(line_surface, (0, 0))
-            else:
-                pygame.draw.lines(surface, line_color, False, points, thickness)
+        # Glow strokes go onto the reused layer; only the line's bounding box is touched
+        xs = self._chart_points_np[:, 0]
+        ys = self._chart_points_np[:, 1]
+        bbox = pygame.Rect(int(xs.min()) - 4, int(ys.min()) - 4,
+                           int(xs.max() - xs.min()) + 8, int(ys.max() - ys.min()) + 8)
+        bbox = bbox.clip(self._glow_rect)
+        local_bbox = bbox.move(-self._glow_rect.left, -self._glow_rect.top)
+        
+        glow_surface = self._glow_surface
+        glow_surface.fill((0, 0, 0, 0), local_bbox)
+        local_points = [(x - self._glow_rect.left, y - self._glow_rect.top) for x, y in points]
+        # draw.lines overwrites rather than blends, so the inner stroke carries
+        # the alpha of two stacked 60-alpha strokes: 255 - (255 - 60)**2 / 255 ≈ 106
+        pygame.draw.lines(glow_surface, (*color, 60), False, local_points, 5)
+        pygame.draw.lines(glow_surface, (*color, 106), False, local_points, 3)
+        surface.blit(glow_surface, bbox.topleft, local_bbox)
+        
+        # Anti-aliased core line straight onto the chart
+        pygame.draw.aalines(surface, color, False, points)
                 
     def render_interactive_points(self, surface: pygame.Surface, chart_points: List[Tuple[int, int]], 
                                  data_points: List[Dict], color: Tuple[int, int, int]):
         """Render interactive data points with professional tooltips"""
         mouse_x, mouse_y = self.mouse_pos
-        hover_radius = 25
+        hover_radius = self.HOVER_RADIUS
         closest_point = None
-        closest_distance = float('inf')
         
-        # Find closest point to mouse
-        for i, (point, data) in enumerate(zip(chart_points, data_points)):
-            x, y = point
-            distance = math.sqrt((mouse_x - x) ** 2 + (mouse_y - y) ** 2)
+        # Mouse nowhere near the plot: no hover search, crosshair or tooltip work
+        if not self._hover_rect.collidepoint(self.mouse_pos):
+            self.hovered_point_index = None
+            self.tooltip.hide()
+            self._render_subtle_dots(surface, chart_points)
+            return
             
-            if distance < hover_radius and distance < closest_distance:
-                closest_distance = distance
-                closest_point = (i, point, data)
+        # Find closest point to mouse. x is sorted, so only the points within
+        # hover_radius horizontally need integer squared distances.
+        hover_radius_sq = hover_radius * hover_radius
+        xs = self._chart_points_np[:, 0]
+        lo = int(np.searchsorted(xs, mouse_x - hover_radius, side='left'))
+        hi = int(np.searchsorted(xs, mouse_x + hover_radius, side='right'))
+        if lo < hi:
+            window = self._chart_points_np[lo:hi]
+            dx = window[:, 0] - mouse_x
+            dy = window[:, 1] - mouse_y
+            d2 = dx * dx + dy * dy
+            offset = int(d2.argmin())
+            if d2[offset] < hover_radius_sq:
+                idx = lo + offset
+                closest_point = (idx, chart_points[idx], data_points[idx])
                 
         self.hovered_point_index = closest_point[0] if closest_point else None
         
@@ -329,14 +452,11 @@ class ProfessionalChartRenderer:
             point_x, point_y = closest_point[1]
             
             # Crosshair lines
-            pygame.draw.line(surface, (100, 150, 200, 150), 
-                           (self.chart_rect.left, point_y), (self.chart_rect.right, point_y), 1)
-            pygame.draw.line(surface, (100, 150, 200, 150), 
-                           (point_x, self.chart_rect.top), (point_x, self.chart_rect.bottom), 1)
+            surface.blit(self._crosshair_h, (self.chart_rect.left, point_y))
+            surface.blit(self._crosshair_v, (point_x, self.chart_rect.top))
             
             # Highlight point
-            pygame.draw.circle(surface, (255, 255, 255), (point_x, point_y), 6)
-            pygame.draw.circle(surface, color, (point_x, point_y), 4)
+            surface.blit(self._highlight_sprites[color], (point_x - 7, point_y - 7))
             
             # Show professional tooltip
             tooltip_data = {
@@ -356,56 +476,61 @@ class ProfessionalChartRenderer:
         else:
             self.tooltip.hide()
             
-        # Render subtle data points along the line
+        self._render_subtle_dots(surface, chart_points)
+        
+    def _render_subtle_dots(self, surface: pygame.Surface, chart_points: List[Tuple[int, int]]):
+        """Render subtle data points along the line, skipping the hovered one"""
         point_spacing = max(1, len(chart_points) // 30)
-        for i in range(0, len(chart_points), point_spacing):
-            x, y = chart_points[i]
-            if i == self.hovered_point_index:
-                continue  # Skip hovered point (already rendered)
-                
-            pygame.draw.circle(surface, (255, 255, 255, 180), (x, y), 2)
+        dot = self._dot_sprite
+        blit_seq = [
+            (dot, (x - 2, y - 2))
+            for i, (x, y) in enumerate(chart_points[::point_spacing])
+            if i * point_spacing != self.hovered_point_index  # Hovered point already rendered
+        ]
+        fblits(surface, blit_seq)
             
     def render_professional_axes(self, surface: pygame.Surface, min_price: float, 
                                 max_price: float, timestamps: List):
         """Render professional axis labels"""
-        font = pygame.font.SysFont("Segoe UI", 9)
+        font = get_font("Segoe UI", 9)
+        
+        text_color = self.text_color
+        price_span = max_price - min_price
         
         # Y-axis (price) labels
-        for i in range(6):
-            price = min_price + (i / 5) * (max_price - min_price)
-            y = self.chart_rect.bottom - (i / 5) * self.chart_rect.height
+        for i, y in enumerate(self._y_tick_positions):
+            price = min_price + (i / 5) * price_span
             
             price_text = format_price(price)
-            text_surface = font.render(price_text, True, self.text_color)
+            text_surface = render_text(font, price_text, text_color)
             surface.blit(text_surface, (5, y - text_surface.get_height() // 2))
             
         # X-axis (time) labels
         if timestamps:
-            for i in range(5):
+            last_index = len(timestamps) - 1
+            label_y = self._x_label_y
+            for i, x in enumerate(self._x_tick_positions):
                 if i < len(timestamps):
-                    timestamp_index = int(i * (len(timestamps) - 1) / 4)
-                    timestamp = timestamps[timestamp_index]
-                    x = self.chart_rect.left + (i / 4) * self.chart_rect.width
+                    timestamp = timestamps[int(i * last_index / 4)]
                     
                     time_text = timestamp.strftime("%H:%M")
-                    text_surface = font.render(time_text, True, self.text_color)
-                    surface.blit(text_surface, (x - text_surface.get_width() // 2, 
-                                               self.chart_rect.bottom + 8))
+                    text_surface = render_text(font, time_text, text_color)
+                    surface.blit(text_surface, (x - text_surface.get_width() // 2, label_y))
                                                
     def render_professional_title(self, surface: pygame.Surface, symbol: str, 
                                  timeframe_label: str, change_percent: float):
         """Render professional chart title"""
-        title_font = pygame.font.SysFont("Segoe UI", 16, bold=True)
-        subtitle_font = pygame.font.SysFont("Segoe UI", 12)
+        title_font = get_font("Segoe UI", 16, bold=True)
+        subtitle_font = get_font("Segoe UI", 12)
         
         # Main title
         title_text = f"{symbol} • {timeframe_label}"
-        title_surface = title_font.render(title_text, True, (220, 230, 250))
+        title_surface = render_text(title_font, title_text, (220, 230, 250))
         
         # Performance indicator
         change_color = self.get_trend_color(change_percent)
         change_text = f"{change_percent:+.2f}%"
-        change_surface = subtitle_font.render(change_text, True, change_color)
+        change_surface = render_text(subtitle_font, change_text, change_color)
         
         # Position
         title_x = self.chart_rect.left
@@ -416,10 +541,13 @@ class ProfessionalChartRenderer:
         
     def render_no_data_chart(self) -> pygame.Surface:
         """Render professional no-data state"""
+        if self._no_data_surface is not None:
+            return self._no_data_surface
+            
         surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         surface.fill((15, 20, 28))
         
-        font = pygame.font.SysFont("Segoe UI", 16)
+        font = get_font("Segoe UI", 16)
         text = "Loading chart data..."
         text_surface = font.render(text, True, (120, 140, 160))
         
@@ -427,6 +555,7 @@ class ProfessionalChartRenderer:
         y = (self.height - text_surface.get_height()) // 2
         surface.blit(text_surface, (x, y))
         
+        self._no_data_surface = surface
         return surface
         
     def handle_mouse_move(self, pos: Tuple[int, int]):
@@ -445,39 +574,50 @@ class ProfessionalButton:
         self.text = text
         self.active = active
         self.hover = False
+        self.font = get_font("Segoe UI", 11, bold=True)
+        
+        # One pre-rendered face per state: (background, text, border)
+        self._sprites = {
+            'active': self._create_sprite((70, 120, 180), (255, 255, 255), (90, 140, 200)),
+            'hover': self._create_sprite((45, 55, 70), (200, 220, 255), (70, 90, 120)),
+            'idle': self._create_sprite((30, 35, 45), (160, 180, 200), (50, 60, 75)),
+        }
         
     def update(self, dt: float, mouse_pos: tuple):
         """Update button state"""
         self.hover = self.rect.collidepoint(mouse_pos)
         
-    def render(self, surface: pygame.Surface):
-        """Render professional button"""
-        # Background
+    def _create_sprite(self, bg_color, text_color, border_color) -> pygame.Surface:
+        """Pre-render the button face for one visual state"""
+        sprite = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = sprite.get_rect()
+        pygame.draw.rect(sprite, bg_color, local_rect, border_radius=4)
+        pygame.draw.rect(sprite, border_color, local_rect, 1, border_radius=4)
+        
+        # Text
+        text_surface = self.font.render(self.text, True, text_color)
+        sprite.blit(text_surface, text_surface.get_rect(center=local_rect.center))
+        return sprite
+        
+    def get_sprite(self) -> pygame.Surface:
+        """Get the pre-rendered face for the current state"""
         if self.active:
-            bg_color = (70, 120, 180)
-            text_color = (255, 255, 255)
-            border_color = (90, 140, 200)
+            return self._sprites['active']
         elif self.hover:
-            bg_color = (45, 55, 70)
-            text_color = (200, 220, 255)
-            border_color = (70, 90, 120)
-        else:
-            bg_color = (30, 35, 45)
-            text_color = (160, 180, 200)
-            border_color = (50, 60, 75)
-            
-        pygame.draw.rect(surface, bg_color, self.rect, border_radius=4)
-        pygame.draw.rect(surface, border_color, self.rect, 1, border_radius=4)
+            return self._sprites['hover']
+        return self._sprites['idle']
         
-        # Text
-        font = pygame.font.SysFont("Segoe UI", 11, bold=True)
-        text_surface = font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+    def render(self, surface: pygame.Surface):
+        """Render professional button"""
+        surface.blit(self.get_sprite(), self.rect)
 
 class ProfessionalCryptoModal:
     """Professional crypto modal with elegant design"""
     
+    # Stats panel rows and their value colors, in display order
+    STATS_LABELS = ("Market Cap", "Volume 24h", "Market Rank", "Circulating Supply")
+    STATS_COLORS = ((120, 200, 150), (120, 200, 150), (200, 180, 120), (200, 220, 255))
+    
     def __init__(self, coin_data: dict, screen_size: tuple):
         self.coin_data = coin_data
         self.screen_size = screen_size
@@ -502,6 +642,9 @@ class ProfessionalCryptoModal:
         self.selected_timeframe = "7d"
         self.chart_surface = None
         self.loading_chart = False
+        self._chart_lock = Lock()
+        self._chart_worker_running = False
+        self._pending_chart = None  # (timeframe, data points) handed over by the worker
         self.entrance_animation = 0
         
         # Timeframes
@@ -520,6 +663,24 @@ class ProfessionalCryptoModal:
         self.mouse_pos = (0, 0)
         self.close_button_rect = None
         
+        # Persistent draw targets: opaque overlay faded via set_alpha, and the modal canvas
+        self._overlay = pygame.Surface(screen_size)
+        self._overlay.fill((0, 0, 0))
+        self._modal_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        
+        # Close button faces, indexed by hover state
+        self._close_sprites = {
+            False: self._create_close_sprite((120, 50, 50), (150, 70, 70), (200, 200, 200)),
+            True: self._create_close_sprite((200, 70, 70), (220, 90, 90), (255, 255, 255)),
+        }
+        
+        # Stats panel background, border and title, rasterized once
+        self._stats_chrome = self._create_stats_chrome()
+        
+        # Header text surfaces, keyed by the strings they were rendered from
+        self._header_key = None
+        self._header_surfaces = None
+        
         print(f"Professional modal created for {self.symbol}")
         self.generate_chart()
         
@@ -540,29 +701,70 @@ class ProfessionalCryptoModal:
             self.buttons[key] = ProfessionalButton(button_rect, info['label'], is_active)
             
     def generate_chart(self):
-        """Generate professional chart"""
-        try:
+        """Generate chart data on a worker thread; the chart is rendered in update()"""
+        with self._chart_lock:
             self.loading_chart = True
+            if self._chart_worker_running:
+                return  # The running worker picks up the new timeframe
+            self._chart_worker_running = True
             
-            timeframe_info = self.timeframes[self.selected_timeframe]
-            current_price = self.coin_data.get('current_price', 1.0)
-            
-            # Generate realistic data
-            data_points = self.data_generator.generate_realistic_data(
-                current_price, self.symbol, timeframe_info['days']
-            )
+        Thread(target=self._generate_chart_worker, daemon=True).start()
+        
+    def _generate_chart_worker(self):
+        """Build chart data, repeating if the timeframe changed meanwhile
+        
+        Only the data series is produced here: fonts and the chart renderer's
+        surfaces and tooltip are used from the main thread only.
+        """
+        while True:
+            timeframe = self.selected_timeframe
+            try:
+                timeframe_info = self.timeframes[timeframe]
+                current_price = self.coin_data.get('current_price', 1.0)
+                
+                # Generate realistic data
+                data_points = self.data_generator.generate_realistic_data(
+                    current_price, self.symbol, timeframe_info['days']
+                )
+                
+            except Exception as e:
+                print(f"Error generating chart: {e}")
+                data_points = None
+                
+            with self._chart_lock:
+                if timeframe == self.selected_timeframe:
+                    self._pending_chart = (timeframe, data_points)
+                    self._chart_worker_running = False
+                    return
+                    
+    def _render_pending_chart(self):
+        """Render chart data handed over by the worker (main thread only)"""
+        with self._chart_lock:
+            pending = self._pending_chart
+            self._pending_chart = None
+        if pending is None:
+            return
             
-            # Render professional chart
-            self.chart_surface = self.chart_renderer.render_price_chart(
-                data_points, self.symbol, timeframe_info['label']
-            )
+        timeframe, data_points = pending
+        if timeframe != self.selected_timeframe:
+            return  # Superseded; a newer worker is already running
             
+        try:
+            if data_points is None:
+                chart_surface = self.chart_renderer.render_no_data_chart()
+            else:
+                chart_surface = self.chart_renderer.render_price_chart(
+                    data_points, self.symbol, self.timeframes[timeframe]['label']
+                )
         except Exception as e:
-            print(f"Error generating chart: {e}")
-            self.chart_surface = self.chart_renderer.render_no_data_chart()
+            print(f"Error rendering chart: {e}")
+            chart_surface = self.chart_renderer.render_no_data_chart()
             
-        self.loading_chart = False
-        
+        self.chart_surface = chart_surface
+        with self._chart_lock:
+            if not self._chart_worker_running:
+                self.loading_chart = False
+                    
     def handle_click(self, pos: tuple) -> bool:
         """Handle modal clicks"""
         if not self.is_active:
@@ -619,6 +821,9 @@ class ProfessionalCryptoModal:
         if not self.is_active:
             return
             
+        # Chart data from the worker is rendered here, on the main thread
+        self._render_pending_chart()
+            
         # Entrance animation
         if self.entrance_animation < 1.0:
             self.entrance_animation = min(1.0, self.entrance_animation + dt * 6)
@@ -641,21 +846,27 @@ class ProfessionalCryptoModal:
             return
             
         # Professional overlay
-        overlay = pygame.Surface(self.screen_size, pygame.SRCALPHA)
-        overlay_alpha = int(200 * self.entrance_animation)
-        overlay.fill((0, 0, 0, overlay_alpha))
-        surface.blit(overlay, (0, 0))
+        self._overlay.set_alpha(int(200 * self.entrance_animation))
+        surface.blit(self._overlay, (0, 0))
         
         # Modal surface
-        modal_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        modal_surface = self._modal_surface
+        modal_surface.fill((0, 0, 0, 0))
         
-        # Render components
+        # Render components: shapes are drawn immediately, sprite blits are
+        # collected and flushed in one batch (none of them sit under a shape)
         self.render_background(modal_surface)
-        self.render_header(modal_surface)
-        self.render_timeframe_buttons(modal_surface)
-        self.render_chart_area(modal_surface)
-        self.render_stats_panel(modal_surface)
-        self.render_close_button(modal_surface)
+        blit_seq = []
+        blit_seq.extend(self._collect_header_blits(modal_surface))
+        blit_seq.extend(self._collect_timeframe_button_blits())
+        blit_seq.extend(self._collect_chart_area_blits())
+        blit_seq.extend(self._collect_stats_panel_blits(modal_surface))
+        blit_seq.extend(self._collect_close_button_blits())
+        fblits(modal_surface, blit_seq)
+        
+        # Tooltip composes its own animated surface, so it goes on top afterwards
+        if not self.loading_chart and self.chart_surface:
+            self.chart_renderer.render_tooltip(modal_surface)
         
         # Apply entrance animation
         scale = self.entrance_animation
@@ -684,159 +895,156 @@ class ProfessionalCryptoModal:
         pygame.draw.rect(surface, (40, 50, 65), (1, 1, self.width-2, self.height-2), 
                         1, border_radius=11)
                         
-    def render_header(self, surface: pygame.Surface):
-        """Render professional header"""
+    def _collect_header_blits(self, surface: pygame.Surface) -> list:
+        """Collect professional header blits (fallback logo is drawn directly)"""
+        blits = []
+        
         # Logo
         logo_size = 40
         logo_x, logo_y = 30, 20
         
-        logo_path = f"assets/logos/{self.symbol.lower()}.png"
-        if os.path.exists(logo_path):
-            try:
-                logo = pygame.image.load(logo_path).convert_alpha()
-                logo = pygame.transform.smoothscale(logo, (logo_size, logo_size))
-                surface.blit(logo, (logo_x, logo_y))
-            except:
-                pygame.draw.circle(surface, (70, 120, 180), 
-                                 (logo_x + logo_size//2, logo_y + logo_size//2), logo_size//2)
+        logo = get_logo_surface(self.symbol, logo_size)
+        if logo:
+            blits.append((logo, (logo_x, logo_y)))
         else:
             pygame.draw.circle(surface, (70, 120, 180), 
                              (logo_x + logo_size//2, logo_y + logo_size//2), logo_size//2)
                              
+        name_surface, symbol_surface, price_surface, change_surface = self._get_header_surfaces()
+        
         # Coin info
-        name_font = pygame.font.SysFont("Segoe UI", 20, bold=True)
-        symbol_font = pygame.font.SysFont("Segoe UI", 14)
+        blits.append((name_surface, (logo_x + logo_size + 15, logo_y + 2)))
+        blits.append((symbol_surface, (logo_x + logo_size + 15, logo_y + 28)))
+        
+        # Current price and 24h change
+        price_x = self.width - price_surface.get_width() - 120
+        blits.append((price_surface, (price_x, logo_y + 2)))
+        blits.append((change_surface, (price_x, logo_y + 32)))
+        return blits
         
+    def _get_header_surfaces(self):
+        """Get header text surfaces, re-rendering only when the coin data text changes"""
         coin_name = self.coin_data.get('name', self.symbol)
         if len(coin_name) > 25:
             coin_name = coin_name[:25] + "..."
-            
-        name_surface = name_font.render(coin_name, True, (220, 230, 250))
-        symbol_surface = symbol_font.render(f"{self.symbol}", True, (160, 180, 210))
-        
-        surface.blit(name_surface, (logo_x + logo_size + 15, logo_y + 2))
-        surface.blit(symbol_surface, (logo_x + logo_size + 15, logo_y + 28))
-        
-        # Current price
-        current_price = self.coin_data.get('current_price', 0)
-        price_text = format_price(current_price)
-        price_font = pygame.font.SysFont("Segoe UI", 24, bold=True)
-        price_surface = price_font.render(price_text, True, (255, 255, 255))
-        
-        price_x = self.width - price_surface.get_width() - 120
-        surface.blit(price_surface, (price_x, logo_y + 2))
-        
-        # 24h change
+        price_text = format_price(self.coin_data.get('current_price', 0))
         change_24h = self.coin_data.get('price_change_percentage_24h', 0) or 0
-        change_color = (80, 200, 120) if change_24h >= 0 else (220, 80, 80)
         change_text = f"{change_24h:+.2f}%"
         
-        change_font = pygame.font.SysFont("Segoe UI", 16, bold=True)
-        change_surface = change_font.render(change_text, True, change_color)
-        surface.blit(change_surface, (price_x, logo_y + 32))
+        key = (coin_name, price_text, change_text)
+        if key != self._header_key:
+            change_color = (80, 200, 120) if change_24h >= 0 else (220, 80, 80)
+            self._header_surfaces = (
+                get_font("Segoe UI", 20, bold=True).render(coin_name, True, (220, 230, 250)),
+                get_font("Segoe UI", 14).render(f"{self.symbol}", True, (160, 180, 210)),
+                get_font("Segoe UI", 24, bold=True).render(price_text, True, (255, 255, 255)),
+                get_font("Segoe UI", 16, bold=True).render(change_text, True, change_color),
+            )
+            self._header_key = key
+        return self._header_surfaces
         
-    def render_timeframe_buttons(self, surface: pygame.Surface):
-        """Render professional timeframe buttons"""
-        for button in self.buttons.values():
-            button.render(surface)
+    def _collect_timeframe_button_blits(self) -> list:
+        """Collect professional timeframe button blits"""
+        return [(button.get_sprite(), button.rect) for button in self.buttons.values()]
             
-    def render_chart_area(self, surface: pygame.Surface):
-        """Render chart area"""
+    def _collect_chart_area_blits(self) -> list:
+        """Collect chart area blits"""
         chart_x, chart_y = 40, 130
         
         if self.loading_chart:
-            loading_surface = self.chart_renderer.render_no_data_chart()
-            surface.blit(loading_surface, (chart_x, chart_y))
+            return [(self.chart_renderer.render_no_data_chart(), (chart_x, chart_y))]
         elif self.chart_surface:
-            surface.blit(self.chart_surface, (chart_x, chart_y))
-            self.chart_renderer.render_tooltip(surface)
+            return [(self.chart_surface, (chart_x, chart_y))]
+        return []
             
-    def render_stats_panel(self, surface: pygame.Surface):
-        """Render professional stats panel"""
-        panel_x = self.width - 280
-        panel_y = 80
+    def _create_stats_chrome(self) -> pygame.Surface:
+        """Pre-render the stats panel background, border and title"""
         panel_width = 260
         panel_height = self.height - 120
+        chrome = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
         
         # Panel background
-        pygame.draw.rect(surface, (25, 30, 40), 
-                        (panel_x, panel_y, panel_width, panel_height), border_radius=8)
-        pygame.draw.rect(surface, (50, 65, 85), 
-                        (panel_x, panel_y, panel_width, panel_height), 1, border_radius=8)
+        pygame.draw.rect(chrome, (25, 30, 40), 
+                        (0, 0, panel_width, panel_height), border_radius=8)
+        pygame.draw.rect(chrome, (50, 65, 85), 
+                        (0, 0, panel_width, panel_height), 1, border_radius=8)
+        
+        # Panel title
+        header_font = get_font("Segoe UI", 12, bold=True)
+        title_surface = render_text(header_font, "MARKET DATA", (180, 200, 230))
+        chrome.blit(title_surface, (20, 20))
+        return chrome
+    
+    def _collect_stats_panel_blits(self, surface: pygame.Surface) -> list:
+        """Collect professional stats panel blits, starting with the cached chrome"""
+        panel_x = self.width - 280
+        panel_y = 80
         
         # Stats data
-        header_font = pygame.font.SysFont("Segoe UI", 12, bold=True)
-        label_font = pygame.font.SysFont("Segoe UI", 10)
-        value_font = pygame.font.SysFont("Segoe UI", 14, bold=True)
+        label_font = get_font("Segoe UI", 10)
+        value_font = get_font("Segoe UI", 14, bold=True)
         
-        # Panel title
-        title_surface = header_font.render("MARKET DATA", True, (180, 200, 230))
-        surface.blit(title_surface, (panel_x + 20, panel_y + 20))
-        
-        stats = [
-            ("Market Cap", format_large_number(self.coin_data.get('market_cap', 0))),
-            ("Volume 24h", format_large_number(self.coin_data.get('total_volume', 0))),
-            ("Market Rank", f"#{self.coin_data.get('market_cap_rank', 'N/A')}" 
-                           if self.coin_data.get('market_cap_rank') != 'N/A' else 'N/A'),
-            ("Circulating Supply", format_supply(self.coin_data.get('circulating_supply', 0)))
-        ]
+        blits = [(self._stats_chrome, (panel_x, panel_y))]
+        
+        values = (
+            format_large_number(self.coin_data.get('market_cap', 0)),
+            format_large_number(self.coin_data.get('total_volume', 0)),
+            f"#{self.coin_data.get('market_cap_rank', 'N/A')}" 
+            if self.coin_data.get('market_cap_rank') != 'N/A' else 'N/A',
+            format_supply(self.coin_data.get('circulating_supply', 0))
+        )
         
         y_offset = panel_y + 50
         line_height = 45
         
-        for i, (label, value) in enumerate(stats):
+        for i, (label, value, value_color) in enumerate(zip(self.STATS_LABELS, values, self.STATS_COLORS)):
             current_y = y_offset + i * line_height
             
             # Label
-            label_surface = label_font.render(label, True, (140, 160, 180))
-            surface.blit(label_surface, (panel_x + 20, current_y))
+            label_surface = render_text(label_font, label, (140, 160, 180))
+            blits.append((label_surface, (panel_x + 20, current_y)))
             
             # Value
-            value_color = (200, 220, 255)
-            if "Market Cap" in label or "Volume" in label:
-                value_color = (120, 200, 150)
-            elif "Rank" in label:
-                value_color = (200, 180, 120)
-                
-            value_surface = value_font.render(str(value), True, value_color)
-            surface.blit(value_surface, (panel_x + 20, current_y + 15))
+            value_surface = render_text(value_font, str(value), value_color)
+            blits.append((value_surface, (panel_x + 20, current_y + 15)))
+            
+        return blits
             
-    def render_close_button(self, surface: pygame.Surface):
-        """Render professional close button (FIXED X BUTTON)"""
+    def _create_close_sprite(self, bg_color, border_color, x_color) -> pygame.Surface:
+        """Pre-render the close button face for one hover state"""
         button_size = 32
-        button_x = self.width - button_size - 15
-        button_y = 15
+        sprite = pygame.Surface((button_size, button_size), pygame.SRCALPHA)
+        local_rect = sprite.get_rect()
         
-        self.close_button_rect = pygame.Rect(button_x, button_y, button_size, button_size)
-        
-        # Check hover state
-        mouse_in_button = self.close_button_rect.collidepoint(
-            self.mouse_pos[0] - self.x, self.mouse_pos[1] - self.y
-        )
-        
-        # Button colors
-        if mouse_in_button:
-            bg_color = (200, 70, 70)
-            border_color = (220, 90, 90)
-            x_color = (255, 255, 255)
-        else:
-            bg_color = (120, 50, 50)
-            border_color = (150, 70, 70)
-            x_color = (200, 200, 200)
-            
         # Background
-        pygame.draw.rect(surface, bg_color, self.close_button_rect, border_radius=4)
-        pygame.draw.rect(surface, border_color, self.close_button_rect, 1, border_radius=4)
+        pygame.draw.rect(sprite, bg_color, local_rect, border_radius=4)
+        pygame.draw.rect(sprite, border_color, local_rect, 1, border_radius=4)
         
         # X symbol (FIXED)
-        center_x = button_x + button_size // 2
-        center_y = button_y + button_size // 2
+        center_x = button_size // 2
+        center_y = button_size // 2
         line_len = button_size // 4
         
         # Draw X with proper lines
-        pygame.draw.line(surface, x_color, 
+        pygame.draw.line(sprite, x_color, 
                         (center_x - line_len, center_y - line_len),
                         (center_x + line_len, center_y + line_len), 2)
-        pygame.draw.line(surface, x_color, 
+        pygame.draw.line(sprite, x_color, 
                         (center_x + line_len, center_y - line_len),
-                        (center_x - line_len, center_y + line_len), 2)
\ No newline at end of file
+                        (center_x - line_len, center_y + line_len), 2)
+        return sprite
+        
+    def _collect_close_button_blits(self) -> list:
+        """Collect professional close button blit (FIXED X BUTTON)"""
+        button_size = 32
+        button_x = self.width - button_size - 15
+        button_y = 15
+        
+        self.close_button_rect = pygame.Rect(button_x, button_y, button_size, button_size)
+        
+        # Check hover state
+        mouse_in_button = self.close_button_rect.collidepoint(
+            self.mouse_pos[0] - self.x, self.mouse_pos[1] - self.y
+        )
+        
+        return [(self._close_sprites[mouse_in_button], self.close_button_rect)]
@@ -2,22 +2,47 @@
 Text and number formatting utilities
 """
 
+import numpy as np
+from functools import lru_cache
+
+# Suffix table for format_large_number, ascending; index 0 means no suffix
+_LARGE_NUMBER_SCALES = np.array([1e3, 1e6, 1e9, 1e12])
+_LARGE_NUMBER_SUFFIXES = ("", "K", "M", "B", "T")
+_LARGE_NUMBER_DIVISORS = (1.0, 1e3, 1e6, 1e9, 1e12)
+
+# Decimal places for format_price, by position against these thresholds
+_PRICE_THRESHOLDS = np.array([0.01, 1.0])
+_PRICE_DECIMALS = ("{:.6f}", "{:.4f}", "{:,.2f}")
+
+def _format_scaled(number, scale_idx):
+    """Format a number for a given index into the suffix table"""
+    if scale_idx == 0:
+        return f"${number:.2f}"
+    return f"${number/_LARGE_NUMBER_DIVISORS[scale_idx]:.1f}{_LARGE_NUMBER_SUFFIXES[scale_idx]}"
+
+@lru_cache(maxsize=4096)
 def format_large_number(number):
     """Format large numbers with K, M, B, T suffixes"""
     if not number or number == 0:
         return "N/A"
     
-    if number >= 1e12:
-        return f"${number/1e12:.1f}T"
-    elif number >= 1e9:
-        return f"${number/1e9:.1f}B"
-    elif number >= 1e6:
-        return f"${number/1e6:.1f}M"
-    elif number >= 1e3:
-        return f"${number/1e3:.1f}K"
-    else:
-        return f"${number:.2f}"
+    scale_idx = 0
+    while scale_idx < 4 and number >= _LARGE_NUMBER_DIVISORS[scale_idx + 1]:
+        scale_idx += 1
+    return _format_scaled(number, scale_idx)
 
+def format_large_numbers(numbers):
+    """Format an array of numbers like format_large_number, in one pass
+    
+    The suffix for every value is picked with a single searchsorted call.
+    NaN and 0 give "N/A".
+    """
+    numbers = np.asarray(numbers, dtype=np.float64)
+    scale_indices = np.searchsorted(_LARGE_NUMBER_SCALES, numbers, side='right').tolist()
+    return [_format_scaled(number, scale_idx) if number == number and number != 0 else "N/A"
+            for number, scale_idx in zip(numbers.tolist(), scale_indices)]
+
+@lru_cache(maxsize=4096)
 def format_supply(supply):
     """Format supply numbers"""
     if not supply or supply == 0:
@@ -32,6 +57,7 @@ def format_supply(supply):
     else:
         return f"{supply:,.0f}"
 
+@lru_cache(maxsize=4096)
 def format_price(price):
     """Format price with appropriate decimal places"""
     if not price or price == 0:
@@ -44,6 +70,13 @@ def format_price(price):
     else:
         return f"${price:,.2f}"
 
+def format_prices(prices):
+    """Format an array of prices like format_price, in one pass"""
+    prices = np.asarray(prices, dtype=np.float64)
+    decimal_indices = np.searchsorted(_PRICE_THRESHOLDS, prices, side='right').tolist()
+    return ["$" + _PRICE_DECIMALS[decimal_idx].format(price) if price == price and price != 0 else "N/A"
+            for price, decimal_idx in zip(prices.tolist(), decimal_indices)]
+
 def format_percentage(percentage):
     """Format percentage with color coding"""
     if percentage is None:
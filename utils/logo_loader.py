@@ -3,12 +3,24 @@ Logo loading and caching utilities
 """
 
 import os
+import time
+import pygame
 import requests
 from PIL import Image
 import io
 
+# Scaled logo surfaces keyed by (symbol, size) -> (surface or None, load time, logo version)
+_LOGO_CACHE = {}
+# Missing logos may still be downloading in the background; look again after this
+_LOGO_RETRY_SECONDS = 30
+
+# Bumped whenever a logo file is downloaded, so readers can redraw
+logo_version = 0
+
 def download_logo(symbol, url):
     """Download and cache cryptocurrency logo"""
+    global logo_version
+    
     os.makedirs("assets/logos", exist_ok=True)
     path = f"assets/logos/{symbol}.png"
     
@@ -22,11 +34,41 @@ def download_logo(symbol, url):
         img = Image.open(io.BytesIO(response.content))
         img = img.convert("RGBA").resize((50, 50), Image.Resampling.LANCZOS)
         img.save(path)
+        logo_version += 1
         return path
     except Exception as e:
         print(f"Error downloading logo for {symbol}: {e}")
         return None
 
+def get_logo_surface(symbol, size):
+    """Get a cryptocurrency logo scaled to size x size, loading it only once"""
+    key = (symbol.lower(), size)
+    cached = _LOGO_CACHE.get(key)
+    if cached is not None:
+        logo, loaded_at, version = cached
+        if (logo is not None or
+                (version == logo_version and time.time() - loaded_at < _LOGO_RETRY_SECONDS)):
+            return logo
+    
+    # Read before looking for the file, so a download finishing meanwhile
+    # still counts as newer than this lookup
+    version = logo_version
+    logo = None
+    path = f"assets/logos/{key[0]}.png"
+    if os.path.exists(path):
+        try:
+            logo = pygame.image.load(path).convert_alpha()
+            logo = pygame.transform.smoothscale(logo, (size, size))
+        except Exception:
+            logo = None
+    
+    _LOGO_CACHE[key] = (logo, time.time(), version)
+    return logo
+
+def get_logo_version():
+    """Get the logo version, bumped every time a logo finishes downloading"""
+    return logo_version
+
 def preload_top_logos(crypto_data, limit=50):
     """Preload logos for top cryptocurrencies"""
     print(f"Preloading logos for top {limit} cryptocurrencies...")
@@ -7,9 +7,12 @@ import datetime
 from threading import Lock
 from utils.data_loader import daily_rank_tracking, daily_start_time, rank_tracking_lock, save_daily_ranks
 
+# Bumped on every tracking update so readers can cache rank changes
+rank_version = 0
+
 def update_daily_rank_tracking(crypto_data):
     """Update daily rank tracking with current data"""
-    global daily_rank_tracking, daily_start_time
+    global daily_rank_tracking, daily_start_time, rank_version
     
     current_date = datetime.datetime.now().date()
     
@@ -33,21 +36,35 @@ def update_daily_rank_tracking(crypto_data):
                 daily_rank_tracking[symbol]['current_rank'] = current_rank
                 daily_rank_tracking[symbol]['last_updated'] = time.time()
         
+        rank_version += 1
         save_daily_ranks()
 
+def _rank_change(symbol):
+    """Rank change and indicator for a symbol; caller holds rank_tracking_lock"""
+    if symbol not in daily_rank_tracking:
+        return 0, ""
+    
+    initial = daily_rank_tracking[symbol]['initial_rank']
+    current = daily_rank_tracking[symbol]['current_rank']
+    change = initial - current
+    
+    if change > 0:
+        return change, f"↑{change}"
+    elif change < 0:
+        return change, f"↓{abs(change)}"
+    else:
+        return 0, "–"
+
 def get_daily_rank_change(symbol):
     """Get daily rank change for a symbol"""
     with rank_tracking_lock:
-        if symbol not in daily_rank_tracking:
-            return 0, ""
-        
-        initial = daily_rank_tracking[symbol]['initial_rank']
-        current = daily_rank_tracking[symbol]['current_rank']
-        change = initial - current
-        
-        if change > 0:
-            return change, f"↑{change}"
-        elif change < 0:
-            return change, f"↓{abs(change)}"
-        else:
-            return 0, "–"
\ No newline at end of file
+        return _rank_change(symbol)
+
+def get_daily_rank_changes(symbols):
+    """Get {symbol: (change, indicator)} for many symbols under one lock"""
+    with rank_tracking_lock:
+        return {symbol: _rank_change(symbol) for symbol in symbols}
+
+def get_rank_version():
+    """Get the rank tracking version, bumped on every update"""
+    return rank_version
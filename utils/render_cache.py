@@ -0,0 +1,43 @@
+"""
+Rendering caches for fonts and text surfaces
+"""
+
+import pygame
+from functools import lru_cache
+
+# SysFont objects keyed by (name, size, bold)
+_FONT_CACHE = {}
+
+def get_font(name, size, bold=False):
+    """Get a system font, constructing each (name, size, bold) only once"""
+    key = (name, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold=bold)
+        _FONT_CACHE[key] = font
+    return font
+
+@lru_cache(maxsize=512)
+def render_text(font, text, color):
+    """Render antialiased text once and reuse the surface on later frames
+
+    The returned surface is shared between callers, so it must not be
+    modified (no set_alpha / fill on it). Once a display mode is set the
+    surface is converted to the display format, so later blits skip the
+    per-blit format mapping.
+    """
+    text_surface = font.render(text, True, color)
+    if pygame.display.get_surface() is not None:
+        text_surface = text_surface.convert_alpha()
+    return text_surface
+
+def fblits(surface, blit_sequence):
+    """Blit a sequence of (source, dest) pairs in one call
+    
+    Uses Surface.fblits where available and falls back to Surface.blits.
+    """
+    batch_blit = getattr(surface, 'fblits', None)
+    if batch_blit:
+        batch_blit(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)